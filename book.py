@@ -5,12 +5,15 @@ import os
 import re
 import gzip
 import pickle
-import hashlib
+import array
 import threading
 import time
 import queue
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import config
 from fonts import FastFontCache
+from hashing import fast_hash
 
 # Try to import ebooklib, but provide fallback
 try:
@@ -21,25 +24,167 @@ except ImportError:
     EBOOKLIB_AVAILABLE = False
     print("⚠️ Warning: ebooklib or beautifulsoup4 not installed. EPUB processing disabled.")
 
+# Try msgpack + zstd for the page cache (much faster than pickle through gzip)
+try:
+    import msgpack
+    import zstandard
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Try to import numpy for vectorized pagination
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba to JIT the wrap inner loop (needs numpy too)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Try the compiled wrap kernel (built from pireader_ext.pyx via setup_ext.py)
+try:
+    import pireader_ext
+    EXT_AVAILABLE = True
+except ImportError:
+    EXT_AVAILABLE = False
+
+# Try to import lxml for C-backed HTML parsing (much faster than html.parser)
+try:
+    import lxml.html
+    import lxml.etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+def html_to_text(html):
+    """Extract plain text from an HTML document string"""
+    if LXML_AVAILABLE:
+        try:
+            return lxml.html.fromstring(html).text_content()
+        except Exception:
+            pass
+    return BeautifulSoup(html, "html.parser").get_text(separator="\n")
+
+_BLOCK_TAGS = ('p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote')
+
+def html_to_paragraphs(html):
+    """Extract block-level paragraph texts from an HTML document string"""
+    if LXML_AVAILABLE:
+        try:
+            doc = lxml.html.fromstring(html)
+            paragraphs = []
+            for el in doc.iter(*_BLOCK_TAGS):
+                # Containers get their text via their leaf blocks
+                if next(el.iterdescendants(*_BLOCK_TAGS), None) is not None:
+                    continue
+                para = " ".join(el.text_content().split())
+                if para:
+                    paragraphs.append(para)
+            if paragraphs:
+                return paragraphs
+        except Exception:
+            pass
+    # Fallback: flatten to text and split on newlines
+    return [p.strip() for p in html_to_text(html).split("\n") if p.strip()]
+
+# One recovering parser, reused across every document's heading scan
+if LXML_AVAILABLE:
+    _HEADING_PARSER = lxml.etree.HTMLParser(recover=True, collect_ids=False)
+    _HEADING_XPATH = lxml.etree.XPath('//h1|//h2|//h3')
+
+def extract_headings(html):
+    """Extract h1/h2/h3 heading texts from an HTML document string"""
+    if LXML_AVAILABLE:
+        try:
+            tree = lxml.etree.HTML(html, _HEADING_PARSER)
+            if tree is not None:
+                return [el.text_content() for el in _HEADING_XPATH(tree)]
+            return []
+        except Exception:
+            pass
+    soup = BeautifulSoup(html, "html.parser")
+    return [heading.text for heading in soup.find_all(['h1', 'h2', 'h3'])]
+
 # Global queue for processing completion notifications
 processing_queue = queue.Queue()
 
+# Compile the cleaning patterns with google-re2's DFA engine when installed;
+# the stdlib backtracking engine is the fallback. clean_text runs these over
+# the whole book text, where RE2 is several times faster.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Precompiled cleaning patterns (clean_text runs these over the whole book)
+_RE_APOS_WORD = _re_engine.compile(r"(\w)'\s+(\w)")
+_RE_APOS_SUFFIX = _re_engine.compile(r"(\w)'\s+([tsmd])\b", _re_engine.IGNORECASE)
+_RE_COLON = _re_engine.compile(r':\s+')
+_RE_DOT = _re_engine.compile(r'\.\s{2,}')
+_RE_BLANK = _re_engine.compile(r'\n\s*\n\s*\n+')
+
 def clean_text(text):
     """Clean text to fix spacing issues"""
-    text = re.sub(r"(\w)'\s+(\w)", r"\1'\2", text)
-    text = re.sub(r"(\w)'\s+([tsmd])\b", r"\1'\2", text, flags=re.IGNORECASE)
-    text = re.sub(r':\s+', ': ', text)
-    text = re.sub(r'\.\s{2,}', '. ', text)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = _RE_APOS_WORD.sub(r"\1'\2", text)
+    text = _RE_APOS_SUFFIX.sub(r"\1'\2", text)
+    text = _RE_COLON.sub(': ', text)
+    text = _RE_DOT.sub('. ', text)
+    text = _RE_BLANK.sub('\n\n', text)
     return text
 
-def extract_chapters_from_epub(book_path):
-    """Extract chapter titles from EPUB"""
+def clean_paragraph(para):
+    """Apply the spacing fixes to one paragraph, skipping rules it can't need"""
+    if "'" in para:
+        para = _RE_APOS_WORD.sub(r"\1'\2", para)
+        para = _RE_APOS_SUFFIX.sub(r"\1'\2", para)
+    if ':' in para:
+        para = _RE_COLON.sub(': ', para)
+    if '  ' in para:
+        para = _RE_DOT.sub('. ', para)
+    return para
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+def write_cache(cache_file, cache_data):
+    """Atomically serialize cache data (msgpack+zstd when available, else pickle+gzip)"""
+    # Write to a temp file and rename so power loss can't corrupt the cache
+    tmp_file = cache_file + '.tmp'
+    if MSGPACK_AVAILABLE:
+        payload = zstandard.ZstdCompressor(level=3).compress(
+            msgpack.packb(cache_data, use_bin_type=True))
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with gzip.open(tmp_file, 'wb') as f:
+            pickle.dump(cache_data, f)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, cache_file)
+
+def read_cache(cache_file):
+    """Load cache data, sniffing the magic bytes for legacy gzip caches"""
+    with open(cache_file, 'rb') as f:
+        payload = f.read()
+    if payload[:4] == _ZSTD_MAGIC and MSGPACK_AVAILABLE:
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload),
+                               raw=False, strict_map_key=False)
+    return pickle.loads(gzip.decompress(payload))
+
+def extract_chapters_from_epub(book_path, book=None):
+    """Extract chapter titles from EPUB, reusing an already-parsed book if given"""
     if not EBOOKLIB_AVAILABLE:
         return []
-    
+
     try:
-        book = epub.read_epub(book_path)
+        if book is None:
+            book = epub.read_epub(book_path)
         chapters = []
         
         # Method 1: Look for table of contents
@@ -56,24 +201,18 @@ def extract_chapters_from_epub(book_path):
                 if item.get_type() == ITEM_DOCUMENT:
                     try:
                         html = item.get_content().decode("utf-8", errors="ignore")
-                        soup = BeautifulSoup(html, "html.parser")
                         # Look for h1-h3 tags
-                        for heading in soup.find_all(['h1', 'h2', 'h3']):
-                            heading_text = heading.text.strip()
+                        for heading in extract_headings(html):
+                            heading_text = heading.strip()
                             if heading_text and len(heading_text) < 100:
                                 chapters.append(heading_text)
                     except:
                         pass
         
-        # Clean up and deduplicate
-        seen = set()
-        cleaned_chapters = []
-        for chapter in chapters:
-            clean_chapter = chapter.strip()
-            if clean_chapter and clean_chapter not in seen:
-                seen.add(clean_chapter)
-                cleaned_chapters.append(clean_chapter)
-        
+        # Clean up and deduplicate, preserving order
+        cleaned_chapters = list(dict.fromkeys(
+            chapter.strip() for chapter in chapters if chapter.strip()))
+
         # Limit to 20 chapters
         return cleaned_chapters[:20]
         
@@ -81,30 +220,82 @@ def extract_chapters_from_epub(book_path):
         print(f"Error extracting chapters: {e}")
         return []
 
+def _line_matches_title(line, norm):
+    """Whether a page line is (the start of) a normalized chapter title"""
+    return bool(line) and (line == norm
+                           or line.startswith(norm)
+                           or (len(line) >= 12 and norm.startswith(line)))
+
+def build_chapter_page_map(pages, chapters):
+    """Map chapter index -> first page showing that chapter's title
+
+    Chapter titles appear in the page text as their own wrapped lines, so
+    each title is searched for in order, resuming past the previous
+    chapter's page. A wrapped heading matches via the prefix test.
+
+    Pages whose lines match several different titles are almost always a
+    rendered table of contents, not chapter starts — EPUB nav documents
+    land in the spine text — and are excluded; without that, every
+    chapter matches the TOC page and the whole map collapses onto it.
+    """
+    norms = [" ".join(title.split()) for title in chapters]
+
+    toc_pages = set()
+    if sum(1 for norm in norms if norm) >= 2:
+        toc_threshold = min(3, sum(1 for norm in norms if norm))
+        for page_num, page in enumerate(pages):
+            hits = sum(1 for norm in norms
+                       if norm and any(_line_matches_title(line, norm)
+                                       for line in page))
+            if hits >= toc_threshold:
+                toc_pages.add(page_num)
+
+    chapter_page_map = {}
+    search_from = 0
+
+    for idx, norm in enumerate(norms):
+        if not norm:
+            continue
+        for page_num in range(search_from, len(pages)):
+            if page_num in toc_pages:
+                continue
+            if any(_line_matches_title(line, norm) for line in pages[page_num]):
+                chapter_page_map[idx] = page_num
+                # Strictly advance so one page can't claim every chapter
+                search_from = page_num + 1
+                break
+
+    return chapter_page_map
+
 def extract_text_fast(path, cache_dir=config.CACHE_DIR, callback=None):
     """Fast text extraction with caching and chapter detection"""
     if not EBOOKLIB_AVAILABLE:
         print("❌ ebooklib not installed. Cannot process EPUB files.")
-        return "Please install ebooklib: pip3 install ebooklib beautifulsoup4", [["Install ebooklib"]], []
+        return "Please install ebooklib: pip3 install ebooklib beautifulsoup4", [["Install ebooklib"]], [], {}
     
     cache_dir = os.path.expanduser(cache_dir)
     os.makedirs(cache_dir, exist_ok=True)
     
     book_stat = os.stat(path)
     cache_key = f"{path}_{book_stat.st_mtime}_{book_stat.st_size}"
-    cache_hash = hashlib.md5(cache_key.encode()).hexdigest()[:16]
+    cache_hash = fast_hash(cache_key)
     cache_file = os.path.join(cache_dir, f"{cache_hash}.pkl.gz")
     
     # Try cache first
     if os.path.exists(cache_file):
         try:
-            with gzip.open(cache_file, 'rb') as f:
-                cached_data = pickle.load(f)
-                if not cached_data.get('partial', False):
-                    print("📂 Loaded from cache")
-                    return cached_data['text'], cached_data['pages'], cached_data.get('chapters', [])
-                else:
-                    print("⚠️ Found partial cache, continuing processing...")
+            cached_data = read_cache(cache_file)
+            if not cached_data.get('partial', False):
+                # Pages are deterministic from (text, font, geometry), so the
+                # cache only stores text; paginate for the current font size
+                font = FastFontCache.get_font(config.FONT_SIZE_NORMAL)
+                pages = paginate_full(cached_data['text'], font)
+                chapters = cached_data.get('chapters', [])
+                print("📂 Loaded from cache")
+                return (cached_data['text'], pages, chapters,
+                        build_chapter_page_map(pages, chapters))
+            else:
+                print("⚠️ Found partial cache, continuing processing...")
         except:
             print("⚠️ Cache corrupted, re-processing...")
     
@@ -112,9 +303,9 @@ def extract_text_fast(path, cache_dir=config.CACHE_DIR, callback=None):
     
     try:
         book = epub.read_epub(path)
-        
-        # Extract chapters first
-        chapters = extract_chapters_from_epub(path)
+
+        # Extract chapters first, from the same parsed book
+        chapters = extract_chapters_from_epub(path, book=book)
         
         # Count total documents
         total_items = sum(1 for item in book.get_items() if item.get_type() == ITEM_DOCUMENT)
@@ -123,27 +314,30 @@ def extract_text_fast(path, cache_dir=config.CACHE_DIR, callback=None):
         # Process enough for good initial reading (at least 50 pages worth)
         print("📖 Processing initial content...")
         parts = []
-        items_processed = 0
+        items_processed = 0  # Successfully decoded, for the stop limits
+        items_consumed = 0   # Spine position the background pass resumes from
+        running_word_count = 0
         target_words = 10000  # Enough for ~40-50 pages
-        
+
         for item in book.get_items():
             if item.get_type() == ITEM_DOCUMENT:
+                items_consumed += 1
                 try:
                     html = item.get_content().decode("utf-8", errors="ignore")
-                    text = BeautifulSoup(html, "html.parser").get_text(separator="\n")
-                    parts.append(text.strip())
+                    for para in html_to_paragraphs(html):
+                        parts.append(clean_paragraph(para))
+                        # Approximate word count, no re-tokenizing
+                        running_word_count += para.count(' ') + 1
                     items_processed += 1
-                    
+
                     # Check if we have enough content
-                    current_words = len("\n".join(parts).split())
-                    if current_words >= target_words or items_processed >= 30:
+                    if running_word_count >= target_words or items_processed >= 30:
                         break
                 except Exception as e:
                     print(f"⚠️ Error processing item: {e}")
                     continue
-        
-        initial_text = "\n".join(parts)
-        text = clean_text(initial_text)
+
+        text = "\n".join(parts)
         
         # Paginate initial
         font = FastFontCache.get_font(config.FONT_SIZE_NORMAL)
@@ -154,75 +348,91 @@ def extract_text_fast(path, cache_dir=config.CACHE_DIR, callback=None):
         # Cache initial
         cache_data = {
             'text': text,
-            'pages': pages,
             'chapters': chapters,
             'partial': True,
             'timestamp': time.time(),
             'book_path': path
         }
-        with gzip.open(cache_file, 'wb') as f:
-            pickle.dump(cache_data, f)
-        
-        # Process full in background
+        # Defer the partial write so quickly-processed books only serialize
+        # once. The timer gets its own snapshot: cancel() can't stop a timer
+        # that already fired, and a shared dict could be serialized while
+        # the background pass is updating it.
+        partial_write_timer = threading.Timer(2.0, write_cache,
+                                              args=(cache_file, dict(cache_data)))
+        partial_write_timer.daemon = True
+        partial_write_timer.start()
+
+        # Process full in background, reusing the already-parsed book and the
+        # documents decoded by the initial pass
+        def decode_item(item):
+            try:
+                html = item.get_content().decode("utf-8", errors="ignore")
+                return [clean_paragraph(p) for p in html_to_paragraphs(html)]
+            except Exception as e:
+                print(f"⚠️ Error in background processing: {e}")
+                return None
+
         def process_full():
             print(f"🔄 Background processing: {os.path.basename(path)}")
-            full_parts = []
-            processed_count = 0
-            
-            # Re-read the book for full processing
-            full_book = epub.read_epub(path)
-            
-            for item in full_book.get_items():
-                if item.get_type() == ITEM_DOCUMENT:
-                    try:
-                        html = item.get_content().decode("utf-8", errors="ignore")
-                        text = BeautifulSoup(html, "html.parser").get_text(separator="\n")
-                        full_parts.append(text.strip())
-                        processed_count += 1
-                        
-                        # Progress indicator for large books
-                        if processed_count % 20 == 0:
-                            print(f"🔄 Processed {processed_count}/{total_items} documents")
-                    except Exception as e:
-                        print(f"⚠️ Error in background processing: {e}")
-                        continue
-            
-            full_text = "\n".join(full_parts)
-            full_text_clean = clean_text(full_text)
+            full_parts = list(parts)
+            processed_count = items_consumed
+
+            # Skip the documents the initial pass consumed; the consumed
+            # index, not the success count, marks where it stopped — a
+            # document that failed to decode must not shift the slice and
+            # re-append its successors' text
+            doc_items = [item for item in book.get_items()
+                         if item.get_type() == ITEM_DOCUMENT]
+            remaining = doc_items[items_consumed:]
+
+            # Overlap zip decompression with HTML parsing (lxml drops the GIL)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for item_paras in executor.map(decode_item, remaining):
+                    if item_paras is not None:
+                        full_parts.extend(item_paras)
+                    processed_count += 1
+
+                    # Progress indicator for large books
+                    if processed_count % 20 == 0:
+                        print(f"🔄 Processed {processed_count}/{total_items} documents")
+
+            full_text_clean = "\n".join(full_parts)
             full_pages = paginate_full(full_text_clean, font)
-            
-            # Update cache with full data
-            cache_data.update({
-                'text': full_text_clean,
-                'pages': full_pages,
-                'partial': False
-            })
-            with gzip.open(cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
-            
+            full_chapter_map = build_chapter_page_map(full_pages, chapters)
+
+            # Full data supersedes the deferred partial write
+            partial_write_timer.cancel()
+
+            # Write a fresh dict rather than mutating the shared one the
+            # partial timer may still be holding
+            write_cache(cache_file, dict(cache_data,
+                                         text=full_text_clean,
+                                         partial=False))
+
             print(f"✅ Full book processed: {len(full_pages)} pages")
             
             # Notify that processing is complete
             if callback:
-                callback(path, full_pages, chapters)
+                callback(path, full_pages, chapters, full_chapter_map)
             else:
                 # Put in queue for main thread to check
                 processing_queue.put({
                     'book_path': path,
                     'pages': full_pages,
-                    'chapters': chapters
+                    'chapters': chapters,
+                    'chapter_page_map': full_chapter_map
                 })
         
         # Start background processing
         threading.Thread(target=process_full, daemon=True).start()
-        
-        return text, pages, chapters
-        
+
+        return text, pages, chapters, build_chapter_page_map(pages, chapters)
+
     except Exception as e:
         print(f"❌ Error processing {os.path.basename(path)}: {e}")
         import traceback
         traceback.print_exc()
-        return f"Error loading book: {str(e)}", [["Error loading book"]], []
+        return f"Error loading book: {str(e)}", [["Error loading book"]], [], {}
 
 def check_processing_complete():
     """Check if any book processing has completed"""
@@ -231,131 +441,228 @@ def check_processing_complete():
     except queue.Empty:
         return None
 
-def paginate_initial(text, font, W=config.DISPLAY_WIDTH, H=config.DISPLAY_HEIGHT, margin=config.DISPLAY_MARGIN):
-    """Paginate initial text"""
+def _word_width(word, font, advance_table):
+    """Width of a word summed from the ASCII advance table, PIL fallback"""
+    width = 0.0
+    for ch in word:
+        code = ord(ch)
+        if code > 127:
+            return font.getlength(word)
+        width += advance_table[code]
+    return width
+
+# Double-array copies of the advance tables for the compiled kernel
+_ext_advance_cache = {}
+
+def _ext_advances(font, advance_table):
+    cache_key = id(font)
+    if cache_key not in _ext_advance_cache:
+        _ext_advance_cache[cache_key] = array.array('d', advance_table)
+    return _ext_advance_cache[cache_key]
+
+def _wrap_paragraph_ext(para, font, advance_table, max_width):
+    """Wrap an ASCII paragraph with the compiled break kernel"""
+    buf = para.encode('ascii')
+    if not buf:
+        return []
+
+    advances = _ext_advances(font, advance_table)
+    ends = pireader_ext.wrap_breaks(buf, advances, float(max_width), advances[32])
+
+    lines = []
+    start = 0
+    for end in ends:
+        lines.append(para[start:end])
+        start = end + 1
+    return lines
+
+# NumPy copies of the advance tables, keyed like FastFontCache's
+_np_advance_cache = {}
+
+def _np_advances(font, advance_table):
+    cache_key = id(font)
+    if cache_key not in _np_advance_cache:
+        _np_advance_cache[cache_key] = np.asarray(advance_table, dtype=np.float64)
+    return _np_advance_cache[cache_key]
+
+def _wrap_paragraph_numpy(para, font, advance_table, max_width):
+    """Wrap an ASCII paragraph via a vectorized prefix-sum over glyph advances"""
+    buf = np.frombuffer(para.encode('ascii'), dtype=np.uint8)
+    n = len(buf)
+    if n == 0:
+        return []
+
+    cum = np.cumsum(_np_advances(font, advance_table)[buf])
+    spaces = np.where(buf == 0x20)[0]
+    lines = []
+    start = 0
+
+    while start < n:
+        base = cum[start - 1] if start > 0 else 0.0
+        # Widest end (exclusive) such that chars [start, end) fit the line
+        end = int(np.searchsorted(cum, base + max_width, side='right'))
+        if end >= n:
+            lines.append(para[start:])
+            break
+
+        # Back up to the last space inside the line; side='right' admits a
+        # space sitting exactly at end, where the line fits to a word
+        # boundary, matching the scalar/numba/cython kernels
+        space_idx = int(np.searchsorted(spaces, end, side='right')) - 1
+        if space_idx >= 0 and spaces[space_idx] > start:
+            break_at = int(spaces[space_idx])
+        else:
+            # Single word wider than the line; emit it whole
+            next_idx = int(np.searchsorted(spaces, start, side='left'))
+            break_at = int(spaces[next_idx]) if next_idx < len(spaces) else n
+
+        lines.append(para[start:break_at])
+        start = break_at + 1
+
+    return lines
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _wrap_breaks_numba(buf, advances, max_width, space_width):
+        """Greedy wrap over a uint8 buffer; returns line end positions"""
+        n = len(buf)
+        ends = np.empty(n + 1, np.int64)
+        count = 0
+        line_width = -1.0  # Sentinel: no words on the line yet
+        word_start = 0
+
+        for i in range(n + 1):
+            if i == n or buf[i] == 32:
+                word_width = 0.0
+                for j in range(word_start, i):
+                    word_width += advances[buf[j]]
+
+                if line_width < 0:
+                    line_width = word_width
+                elif line_width + space_width + word_width <= max_width:
+                    line_width += space_width + word_width
+                else:
+                    ends[count] = word_start - 1
+                    count += 1
+                    line_width = word_width
+
+                word_start = i + 1
+
+        if line_width >= 0:
+            ends[count] = n
+            count += 1
+
+        return ends[:count]
+
+def _wrap_paragraph_numba(para, font, advance_table, max_width):
+    """Wrap an ASCII paragraph with the JIT-compiled break kernel"""
+    buf = np.frombuffer(para.encode('ascii'), dtype=np.uint8)
+    if len(buf) == 0:
+        return []
+
+    advances = _np_advances(font, advance_table)
+    ends = _wrap_breaks_numba(buf, advances, float(max_width), advances[32])
+
+    lines = []
+    start = 0
+    for end in ends:
+        lines.append(para[start:end])
+        start = end + 1
+    return lines
+
+def _wrap_paragraph_scalar(para, font, advance_table, max_width):
+    """Wrap a paragraph greedily, measuring each word once"""
+    space_width = advance_table[32]
+    lines = []
+    current_words = []
+    line_width = 0
+
+    for word in para.split():
+        word_width = _word_width(word, font, advance_table)
+        new_width = line_width + (space_width if current_words else 0) + word_width
+
+        if new_width <= max_width:
+            current_words.append(word)
+            line_width = new_width
+        else:
+            if current_words:
+                lines.append(" ".join(current_words))
+            current_words = [word]
+            line_width = word_width
+
+    if current_words:
+        lines.append(" ".join(current_words))
+
+    return lines
+
+def wrap_paragraph(para, font, max_width):
+    """Wrap a paragraph into lines no wider than max_width"""
+    advance_table = FastFontCache.get_advance_table(font)
+    if para.isascii():
+        # Collapse runs of whitespace like split/join would, then vectorize
+        normalized = " ".join(para.split())
+        if EXT_AVAILABLE:
+            return _wrap_paragraph_ext(normalized, font, advance_table, max_width)
+        if NUMBA_AVAILABLE:
+            return _wrap_paragraph_numba(normalized, font, advance_table, max_width)
+        if NUMPY_AVAILABLE:
+            return _wrap_paragraph_numpy(normalized, font, advance_table, max_width)
+    return _wrap_paragraph_scalar(para, font, advance_table, max_width)
+
+def _wrapped_lines(text, font, max_width):
+    """Yield wrapped lines, with a single blank line between spaced paragraphs"""
+    last_blank = True  # Suppress leading blanks
+    for para in text.split("\n"):
+        para = para.strip()
+        if not para:
+            if not last_blank:
+                yield ""
+                last_blank = True
+            continue
+        for line in wrap_paragraph(para, font, max_width):
+            yield line
+            last_blank = False
+
+def paginate_stream(text, font, W=config.DISPLAY_WIDTH, H=config.DISPLAY_HEIGHT, margin=config.DISPLAY_MARGIN):
+    """Yield pages of wrapped lines as soon as each page fills"""
     bbox = font.getbbox("Hg")
     line_height = bbox[3] + 1
     footer_height = line_height * 1.5
     usable_height = H - (2 * margin) - footer_height
     max_lines_per_page = int(usable_height / line_height)
-    
-    paragraphs = text.split("\n")
-    all_lines = []
-    lines_collected = 0
-    max_initial_lines = max_lines_per_page * 50  # Enough for 50 pages
-    
-    for para in paragraphs:
-        if lines_collected >= max_initial_lines:
-            break
-        
-        para = para.strip()
-        if not para:
-            if all_lines and all_lines[-1] != "":
-                all_lines.append("")
-                lines_collected += 1
-            continue
-        
-        words = para.split()
-        current_line = ""
-        
-        for word in words:
-            if lines_collected >= max_initial_lines:
-                break
-            
-            test_line = f"{current_line} {word}".strip() if current_line else word
-            line_width = font.getlength(test_line)
-            
-            if line_width <= (W - 2 * margin):
-                current_line = test_line
-            else:
-                if current_line:
-                    all_lines.append(current_line)
-                    lines_collected += 1
-                current_line = word
-        
-        if current_line and lines_collected < max_initial_lines:
-            all_lines.append(current_line)
-            lines_collected += 1
-    
-    # Split into pages
-    pages = []
+    max_width = W - 2 * margin
+
     current_page_lines = []
-    
-    for line in all_lines:
+
+    for line in _wrapped_lines(text, font, max_width):
         if len(current_page_lines) >= max_lines_per_page:
-            if current_page_lines:
-                pages.append(current_page_lines)
-                current_page_lines = []
+            yield current_page_lines
+            current_page_lines = []
             if line == "":
                 continue
         current_page_lines.append(line)
-    
+
     if current_page_lines:
-        pages.append(current_page_lines)
-    
+        yield current_page_lines
+
+def paginate_initial(text, font, W=config.DISPLAY_WIDTH, H=config.DISPLAY_HEIGHT, margin=config.DISPLAY_MARGIN):
+    """Paginate initial text (first 50 pages at most)"""
+    pages = list(islice(paginate_stream(text, font, W, H, margin), 50))
+
     if not pages:
         pages = [["Loading..."]]
-    
+
     return pages
 
 def paginate_full(text, font, W=config.DISPLAY_WIDTH, H=config.DISPLAY_HEIGHT, margin=config.DISPLAY_MARGIN):
     """Full pagination"""
-    bbox = font.getbbox("Hg")
-    line_height = bbox[3] + 1
-    footer_height = line_height * 1.5
-    usable_height = H - (2 * margin) - footer_height
-    max_lines_per_page = int(usable_height / line_height)
-    
-    paragraphs = text.split("\n")
-    all_lines = []
-    
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            if all_lines and all_lines[-1] != "":
-                all_lines.append("")
-            continue
-        
-        words = para.split()
-        current_line = ""
-        
-        for word in words:
-            test_line = f"{current_line} {word}".strip() if current_line else word
-            line_width = font.getlength(test_line)
-            
-            if line_width <= (W - 2 * margin):
-                current_line = test_line
-            else:
-                if current_line:
-                    all_lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            all_lines.append(current_line)
-    
-    # Split into pages
-    pages = []
-    current_page_lines = []
-    
-    for line in all_lines:
-        if len(current_page_lines) >= max_lines_per_page:
-            if current_page_lines:
-                pages.append(current_page_lines)
-                current_page_lines = []
-            if line == "":
-                continue
-        current_page_lines.append(line)
-    
-    if current_page_lines:
-        pages.append(current_page_lines)
-    
-    # Clean up
+    # Clean up trailing blank lines per page
     cleaned_pages = []
-    for page in pages:
+    for page in paginate_stream(text, font, W, H, margin):
         while page and page[-1] == "":
             page.pop()
         if page:
             cleaned_pages.append(page)
-    
+
     print(f"📄 Full pagination: {len(cleaned_pages)} pages")
     return cleaned_pages
\ No newline at end of file
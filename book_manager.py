@@ -3,9 +3,9 @@
 
 import os
 import json
-import glob
 from datetime import datetime
 import config
+from bookmarks import open_bookmark_db
 
 class BookManager:
     def __init__(self, books_dir=config.BOOKS_DIR):
@@ -13,37 +13,60 @@ class BookManager:
         self.last_book_file = os.path.join(config.BOOKMARK_DIR, "last_book.json")
         os.makedirs(self.books_dir, exist_ok=True)
         os.makedirs(config.BOOKMARK_DIR, exist_ok=True)
+        self._db = open_bookmark_db()
     
     def get_all_books(self):
         """Get all EPUB books in the books directory"""
-        books = []
-        patterns = ['*.epub', '*.EPUB', '*.mobi', '*.MOBI', '*.pdf', '*.PDF']
-        
-        for pattern in patterns:
-            books.extend(glob.glob(os.path.join(self.books_dir, pattern)))
-        
+        extensions = {'.epub', '.mobi', '.pdf'}
+
+        # One directory scan; DirEntry caches the stat for the mtime sort
+        entries = [entry for entry in os.scandir(self.books_dir)
+                   if entry.is_file()
+                   and os.path.splitext(entry.name)[1].lower() in extensions]
+
         # Sort by modification time (newest first)
-        books.sort(key=os.path.getmtime, reverse=True)
-        
-        # Get just the filenames
-        book_names = [os.path.basename(book) for book in books]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+        books = [entry.path for entry in entries]
+        book_names = [entry.name for entry in entries]
         return books, book_names
     
     def save_last_book(self, book_path):
         """Save the last opened book"""
         try:
-            last_book_data = {
-                'path': book_path,
-                'filename': os.path.basename(book_path),
-                'last_opened': datetime.now().isoformat()
-            }
-            with open(self.last_book_file, 'w') as f:
-                json.dump(last_book_data, f)
+            # Single-row meta table, separate from bookmarks so opening a
+            # book never plants a placeholder page that would shadow the
+            # legacy-JSON bookmark migration
+            self._db.execute(
+                "INSERT INTO last_book (id, book_path, last_accessed) "
+                "VALUES (1, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET "
+                "book_path=excluded.book_path, "
+                "last_accessed=excluded.last_accessed",
+                (book_path, datetime.now().isoformat()))
+            self._db.commit()
         except Exception as e:
             print(f"Error saving last book: {e}")
-    
+
     def get_last_book(self):
         """Get the last opened book"""
+        try:
+            row = self._db.execute(
+                "SELECT book_path FROM last_book WHERE id=1").fetchone()
+            if row and os.path.exists(row[0]):
+                return row[0]
+
+            # Older databases tracked last-opened via bookmark access times
+            rows = self._db.execute(
+                "SELECT book_path FROM bookmarks "
+                "ORDER BY last_accessed DESC").fetchall()
+            for (book_path,) in rows:
+                if os.path.exists(book_path):
+                    return book_path
+        except:
+            pass
+
+        # Fall back to the legacy last_book.json from before the database
         if os.path.exists(self.last_book_file):
             try:
                 with open(self.last_book_file, 'r') as f:
@@ -53,12 +76,12 @@ class BookManager:
                     return data['path']
             except:
                 pass
-        
+
         # If no last book, try to find any book
         books, _ = self.get_all_books()
         if books:
             return books[0]
-        
+
         return None
     
     def get_book_path(self, book_filename):
@@ -4,53 +4,113 @@
 import os
 import json
 import datetime
+import sqlite3
 import threading
-import hashlib
+import queue
 import config
+from hashing import fast_hash, legacy_hash
+
+def open_bookmark_db(db_path=config.BOOKMARK_DB):
+    """Open the shared bookmark database, creating the schema if needed"""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    db = sqlite3.connect(db_path, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS bookmarks ("
+               "book_path TEXT PRIMARY KEY, "
+               "page_num INTEGER, "
+               "last_accessed TEXT)")
+    # Last-opened tracking lives in its own single-row table; inserting
+    # placeholder bookmark rows would mask the legacy-JSON migration
+    db.execute("CREATE TABLE IF NOT EXISTS last_book ("
+               "id INTEGER PRIMARY KEY CHECK (id = 1), "
+               "book_path TEXT, "
+               "last_accessed TEXT)")
+    db.commit()
+    return db
 
 class BookmarkManager:
     def __init__(self, bookmark_dir=config.BOOKMARK_DIR):
         self.bookmark_dir = bookmark_dir
         os.makedirs(self.bookmark_dir, exist_ok=True)
         self._cache = {}
-    
+        self._db = open_bookmark_db()
+        self._db_lock = threading.Lock()
+        self._save_queue = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
     def get_bookmark_path(self, book_path):
-        book_hash = hashlib.md5(book_path.encode()).hexdigest()[:16]
+        """Path of a legacy per-book JSON bookmark file"""
+        book_hash = fast_hash(book_path)
         return os.path.join(self.bookmark_dir, f"bookmark_{book_hash}.json")
-    
+
     def load_bookmark(self, book_path):
         """Load saved page"""
         if book_path in self._cache:
             return self._cache[book_path]
-        
-        bookmark_path = self.get_bookmark_path(book_path)
-        if os.path.exists(bookmark_path):
-            try:
-                with open(bookmark_path, 'r') as f:
-                    data = json.load(f)
-                if data.get('book_path') == book_path:
-                    page = data['page_num']
-                    self._cache[book_path] = page
-                    return page
-            except:
-                pass
-        
+
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT page_num FROM bookmarks WHERE book_path=?",
+                (book_path,)).fetchone()
+        if row is not None:
+            self._cache[book_path] = row[0]
+            return row[0]
+
+        # Fall back to bookmarks saved as per-book JSON files and migrate
+        page = self._load_legacy_bookmark(book_path)
+        if page is not None:
+            self._cache[book_path] = page
+            self._save_queue.put((book_path, page))
+            return page
+
         return 1
-    
+
+    def _load_legacy_bookmark(self, book_path):
+        """Read a bookmark written by the old one-JSON-per-book scheme"""
+        for book_hash in (fast_hash(book_path), legacy_hash(book_path)):
+            legacy_path = os.path.join(self.bookmark_dir,
+                                       f"bookmark_{book_hash}.json")
+            if os.path.exists(legacy_path):
+                try:
+                    with open(legacy_path, 'r') as f:
+                        data = json.load(f)
+                    if data.get('book_path') == book_path:
+                        return data['page_num']
+                except:
+                    pass
+        return None
+
     def save_bookmark_async(self, book_path, page_num):
-        """Save bookmark in background"""
-        def save():
-            bookmark_path = self.get_bookmark_path(book_path)
-            bookmark_data = {
-                'book_path': book_path,
-                'page_num': page_num,
-                'last_accessed': datetime.datetime.now().isoformat()
-            }
+        """Queue a bookmark save, skipping pages already saved"""
+        if self._cache.get(book_path) == page_num:
+            return
+        self._cache[book_path] = page_num
+        self._save_queue.put((book_path, page_num))
+
+    def _save_worker(self):
+        """Single background thread draining queued saves"""
+        while True:
+            book_path, page_num = self._save_queue.get()
+            # Coalesce a burst of page turns into one write per book
+            pending = {book_path: page_num}
             try:
-                with open(bookmark_path, 'w') as f:
-                    json.dump(bookmark_data, f)
-                self._cache[book_path] = page_num
-            except:
+                while True:
+                    book_path, page_num = self._save_queue.get(timeout=0.5)
+                    pending[book_path] = page_num
+            except queue.Empty:
                 pass
-        
-        threading.Thread(target=save, daemon=True).start()
\ No newline at end of file
+
+            for book_path, page_num in pending.items():
+                self._write_bookmark(book_path, page_num)
+
+    def _write_bookmark(self, book_path, page_num):
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO bookmarks VALUES (?, ?, ?)",
+                    (book_path, page_num,
+                     datetime.datetime.now().isoformat()))
+                self._db.commit()
+        except:
+            pass
@@ -25,6 +25,7 @@ FONT_SIZE_SMALL = 14
 BOOKS_DIR = os.path.expanduser("~/books")  # Default books directory
 CACHE_DIR = os.path.expanduser("~/.ebook_cache")
 BOOKMARK_DIR = os.path.expanduser("~/.ebook_reader")
+BOOKMARK_DB = os.path.join(BOOKMARK_DIR, "bookmarks.db")
 
 # Display settings
 FULL_REFRESH_INTERVAL = 100  # Pages between full refreshes
@@ -6,6 +6,24 @@ import threading
 import RPi.GPIO as GPIO
 import config
 
+# libgpiod v2 delivers timestamped edge events from /dev/gpiochip0; used as
+# a fallback when RPi.GPIO's add_event_detect isn't available
+try:
+    import gpiod
+    from gpiod.line import Edge, Bias
+    from datetime import timedelta
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
+
+# Debounce window, filtered in-kernel by add_event_detect's bouncetime;
+# the polling fallback uses the same window as its scan interval
+DEBOUNCE_MS = 20
+
+# Long-press threshold; press timestamps are integer monotonic_ns so the
+# hot-path compare is an integer subtract, immune to float precision drift
+LONG_PRESS_NS = 500_000_000
+
 class FourButtonControls:
     def __init__(self):
         # GPIO assignments
@@ -14,10 +32,30 @@ class FourButtonControls:
         self.BTN_MENU = config.GPIO_MENU
         self.BTN_BACK = config.GPIO_BACK
         
-        # Button tracking
-        self.press_times = {}
-        self.last_states = {}
-        self.running = True
+        # Button tracking: fixed four-slot lists indexed by _pin_slot, so
+        # press bookkeeping is a list index instead of dict insert/delete
+        self._pin_to_name = {
+            self.BTN_PREV: 'prev',
+            self.BTN_NEXT: 'next',
+            self.BTN_MENU: 'menu',
+            self.BTN_BACK: 'back'
+        }
+        self._pin_slot = {pin: slot for slot, pin in enumerate(self._pin_to_name)}
+        self._press_ts = [0, 0, 0, 0]
+        self._pressed = [False, False, False, False]
+        self._last_pressed = [True, True, True, True]
+        self._stop = threading.Event()
+        self._monitor_thread = None
+        # Set on any press edge so the main run loop can idle between events
+        self.wake_event = threading.Event()
+        # Dispatches before this monotonic_ns stamp are dropped: edges that
+        # arrive while wait_for_press blocks the dispatch thread would
+        # otherwise replay as stray actions right after waking
+        self._ignore_before_ns = 0
+        self._edge_driven = False
+        self._gpiod_request = None
+        self._pins = tuple((pin, self._pin_slot[pin], name)
+                           for pin, name in self._pin_to_name.items())
         
         # Application state
         self.current_state = "READING"  # READING, MAIN_MENU, JUMP_MENU, CHAPTER_MENU, BROWSER_MENU, SLEEP_MENU, SHUTDOWN_CONFIRM
@@ -35,15 +73,73 @@ class FourButtonControls:
         self.browser_menu = []  # Will be populated with books
         self.chapter_menu = []  # Will be populated with chapters
         self.chapter_page_map = {}  # Maps chapter index to page number
-        
-        # Callbacks
-        self.callbacks = {
-            'state_changed': None,
-            'menu_action': None,
-            'page_change': None,
-            'chapter_select': None,
-            'book_select': None
+
+        # Pre-parsed signed jump amounts, aligned with jump_menu (None = "Back")
+        self._jump_deltas = []
+        for label in self.jump_menu:
+            if label.startswith('+'):
+                self._jump_deltas.append(int(label[1:].split()[0]))
+            elif label.startswith('-'):
+                self._jump_deltas.append(-int(label[1:].split()[0]))
+            else:
+                self._jump_deltas.append(None)
+
+        # Main-menu actions resolved from labels once, indexed by menu_index
+        label_actions = {
+            "Resume": self._goto_reading,
+            "Jump Pages": self._goto_jump,
+            "Skip to Chapter": self._goto_chapters,
+            "Refresh Book": self._do_refresh,
+            "Select Book": self._goto_browser,
+            "Sleep": self._goto_sleep,
+            "Shutdown": self._goto_shutdown
+        }
+        self._main_menu_actions = [label_actions[label] for label in self.main_menu]
+
+        # Main-menu index each sub-menu's back path returns to, looked up
+        # from the labels so reordering MAIN_MENU can't desync them
+        self._return_idx = {
+            state: self.main_menu.index(label)
+            for state, label in (("JUMP_MENU", "Jump Pages"),
+                                 ("CHAPTER_MENU", "Skip to Chapter"),
+                                 ("BROWSER_MENU", "Select Book"),
+                                 ("SLEEP_MENU", "Sleep"),
+                                 ("SHUTDOWN_CONFIRM", "Shutdown"))
+        }
+
+        # The three list submenus share one handler; each state carries its
+        # menu and a (kind, value) selection per entry
+        jump_selections = [('jump', delta) if delta is not None else ('back', None)
+                           for delta in self._jump_deltas]
+        self._submenu_defs = {
+            "JUMP_MENU": (self.jump_menu, jump_selections),
+            "SLEEP_MENU": (self.sleep_menu,
+                           [('action', 'sleep'), ('back', None)]),
+            "SHUTDOWN_CONFIRM": (self.shutdown_menu,
+                                 [('action', 'shutdown'), ('back', None)])
+        }
+
+        # State dispatch table (states stay strings: main.py matches on them)
+        self._state_handlers = {
+            "READING": self._handle_reading_mode,
+            "MAIN_MENU": self._handle_main_menu,
+            "JUMP_MENU": self._handle_list_menu,
+            "CHAPTER_MENU": self._handle_chapter_menu,
+            "BROWSER_MENU": self._handle_browser_menu,
+            "SLEEP_MENU": self._handle_list_menu,
+            "SHUTDOWN_CONFIRM": self._handle_list_menu
         }
+
+        # Callbacks, cached as attributes so hot paths skip dict lookups.
+        # No lock on purpose: register_callback's attribute store is a
+        # single atomic reference swap in CPython, so the monitor thread
+        # always reads either the old value or the new one, never a torn
+        # state. Holds only while callbacks are plain rebinds like this.
+        self._cb_state_changed = None
+        self._cb_menu_action = None
+        self._cb_page_change = None
+        self._cb_chapter_select = None
+        self._cb_book_select = None
         
         self.setup_gpio()
         self.start_monitoring()
@@ -57,7 +153,6 @@ class FourButtonControls:
         buttons = [self.BTN_PREV, self.BTN_NEXT, self.BTN_MENU, self.BTN_BACK]
         for pin in buttons:
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            self.last_states[pin] = True
         
         print("✅ Buttons: Prev(GPIO4), Next(GPIO27), Menu(GPIO22), Back(GPIO23)")
     
@@ -77,94 +172,186 @@ class FourButtonControls:
         self.browser_page = 0
     
     def start_monitoring(self):
-        """Start button monitoring thread"""
-        thread = threading.Thread(target=self._monitor_buttons, daemon=True)
-        thread.start()
+        """Deliver button edges via kernel interrupts, polling as fallback"""
+        registered = []
+        try:
+            for pin in self._pin_to_name:
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._edge_cb,
+                                      bouncetime=DEBOUNCE_MS)
+                registered.append(pin)
+            self._edge_driven = True
+            print("✅ Edge-triggered button events enabled")
+        except (RuntimeError, AttributeError):
+            # Drop any callbacks that did register before the failure, or
+            # the fallback would dispatch those pins' presses twice
+            for pin in registered:
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
+            # Older kernels/drivers without edge support: try libgpiod,
+            # then fall back to polling
+            if self._start_gpiod():
+                return
+            self._monitor_thread = threading.Thread(target=self._monitor_buttons,
+                                                    daemon=True)
+            self._monitor_thread.start()
+
+    def _start_gpiod(self):
+        """Request libgpiod edge events; one blocking poll in C per edge
+        instead of 50 Python scan iterations a second"""
+        if not GPIOD_AVAILABLE:
+            return False
+        try:
+            settings = gpiod.LineSettings(
+                edge_detection=Edge.BOTH, bias=Bias.PULL_UP,
+                debounce_period=timedelta(milliseconds=DEBOUNCE_MS))
+            self._gpiod_request = gpiod.request_lines(
+                "/dev/gpiochip0", consumer="pireader",
+                config={tuple(self._pin_to_name): settings})
+        except (OSError, AttributeError):
+            return False
+        self._monitor_thread = threading.Thread(target=self._monitor_gpiod,
+                                                daemon=True)
+        self._monitor_thread.start()
+        print("✅ libgpiod edge events enabled")
+        return True
+
+    def _monitor_gpiod(self):
+        """Block on the gpiochip fd and dispatch timestamped edge events"""
+        request = self._gpiod_request
+        falling = gpiod.EdgeEvent.Type.FALLING_EDGE
+        while not self._stop.is_set():
+            if not request.wait_edge_events(timedelta(milliseconds=200)):
+                continue
+            for event in request.read_edge_events():
+                pin = event.line_offset
+                slot = self._pin_slot[pin]
+                if event.event_type == falling:  # Pressed (pull-up wiring)
+                    self._press_ts[slot] = event.timestamp_ns
+                    self._pressed[slot] = True
+                    self.wake_event.set()
+                elif self._pressed[slot]:
+                    self._pressed[slot] = False
+                    self._handle_button(self._pin_to_name[pin],
+                                        event.timestamp_ns - self._press_ts[slot])
+        request.release()
+
+    def _edge_cb(self, pin):
+        """Kernel edge callback: track press on falling, dispatch on rising"""
+        slot = self._pin_slot[pin]
+        if GPIO.input(pin) == GPIO.LOW:  # Pressed
+            self._press_ts[slot] = time.monotonic_ns()
+            self._pressed[slot] = True
+            self.wake_event.set()
+        elif self._pressed[slot]:  # Released
+            self._pressed[slot] = False
+            self._handle_button(self._pin_to_name[pin],
+                                time.monotonic_ns() - self._press_ts[slot])
     
     def _monitor_buttons(self):
         """Monitor button presses"""
-        while self.running:
-            current_time = time.time()
-            
+        # Hot-loop locals: skip per-tick attribute and module-global lookups
+        pins = self._pins
+        press_ts = self._press_ts
+        pressed = self._pressed
+        last_pressed = self._last_pressed
+        gpio_input = GPIO.input
+        gpio_low = GPIO.LOW
+        monotonic_ns = time.monotonic_ns
+
+        while not self._stop.is_set():
+            # Monotonic so NTP clock jumps can't fake long presses
+            current_time = monotonic_ns()
+
             # Check each button
-            for pin, name in [
-                (self.BTN_PREV, 'prev'),
-                (self.BTN_NEXT, 'next'),
-                (self.BTN_MENU, 'menu'),
-                (self.BTN_BACK, 'back')
-            ]:
-                current_state = GPIO.input(pin) == GPIO.LOW  # LOW = pressed
-                last_state = self.last_states[pin]
-                
+            for pin, slot, name in pins:
+                current_state = gpio_input(pin) == gpio_low  # LOW = pressed
+                last_state = last_pressed[slot]
+
                 # Button just pressed
                 if current_state and not last_state:
-                    self.press_times[pin] = current_time
-                
+                    press_ts[slot] = current_time
+                    pressed[slot] = True
+                    self.wake_event.set()
+
                 # Button just released
                 elif not current_state and last_state:
-                    if pin in self.press_times:
-                        duration = current_time - self.press_times[pin]
-                        self._handle_button(name, duration)
-                        del self.press_times[pin]
-                
-                self.last_states[pin] = current_state
+                    if pressed[slot]:
+                        pressed[slot] = False
+                        self._handle_button(name, current_time - press_ts[slot])
+
+                last_pressed[slot] = current_state
             
-            time.sleep(0.02)
-    
-    def _handle_button(self, button, duration):
-        """Handle button press with duration"""
-        is_long_press = duration >= 0.5
-        
-        # Handle based on current state
-        if self.current_state == "READING":
-            self._handle_reading_mode(button, is_long_press)
-        
-        elif self.current_state == "MAIN_MENU":
-            self._handle_main_menu(button, is_long_press)
-        
-        elif self.current_state == "JUMP_MENU":
-            self._handle_jump_menu(button, is_long_press)
-        
-        elif self.current_state == "CHAPTER_MENU":
-            self._handle_chapter_menu(button, is_long_press)
-        
-        elif self.current_state == "BROWSER_MENU":
-            self._handle_browser_menu(button, is_long_press)
-        
-        elif self.current_state == "SLEEP_MENU":
-            self._handle_sleep_menu(button, is_long_press)
-        
-        elif self.current_state == "SHUTDOWN_CONFIRM":
-            self._handle_shutdown_menu(button, is_long_press)
+            # Interruptible wait so cleanup() doesn't have to guess a delay
+            if self._stop.wait(DEBOUNCE_MS / 1000):
+                break
+
+    def wait_for_press(self, timeout=10):
+        """Block until any button is pressed, polling the pins directly
+
+        Used by sleep mode, which runs on the button-dispatch thread: the
+        monitor that sets wake_event is the thread blocked in this call,
+        so waiting on the event would deadlock until the timeout. Reading
+        the pin levels needs no help from the monitor. Returns True on a
+        press, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        pressed = False
+        while time.monotonic() < deadline:
+            if any(GPIO.input(pin) == GPIO.LOW for pin, slot, name in self._pins):
+                pressed = True
+                break
+            if self._stop.wait(DEBOUNCE_MS / 1000):
+                break
+        # Swallow the edges queued while we were blocking; the wake press
+        # must not double as a page turn or menu action
+        self._ignore_before_ns = time.monotonic_ns() + LONG_PRESS_NS
+        return pressed
+
+    def _emit_state(self, selected_index):
+        """Notify the state_changed callback, if registered"""
+        if self._cb_state_changed:
+            self._cb_state_changed(self.current_state, selected_index)
+
+    def _handle_button(self, button, duration_ns):
+        """Handle button press with duration in nanoseconds"""
+        if time.monotonic_ns() < self._ignore_before_ns:
+            return
+        is_long_press = duration_ns >= LONG_PRESS_NS
+
+        # Dispatch based on current state
+        handler = self._state_handlers.get(self.current_state)
+        if handler:
+            handler(button, is_long_press)
     
     def _handle_reading_mode(self, button, long_press):
         """Handle buttons in reading mode"""
         if button == 'prev':
             if long_press:
                 # Quick jump back
-                if self.callbacks.get('page_change'):
-                    self.callbacks['page_change'](-10)
+                if self._cb_page_change:
+                    self._cb_page_change(-10)
             else:
                 # Normal page back
-                if self.callbacks.get('page_change'):
-                    self.callbacks['page_change'](-1)
+                if self._cb_page_change:
+                    self._cb_page_change(-1)
         
         elif button == 'next':
             if long_press:
                 # Quick jump forward
-                if self.callbacks.get('page_change'):
-                    self.callbacks['page_change'](10)
+                if self._cb_page_change:
+                    self._cb_page_change(10)
             else:
                 # Normal page forward
-                if self.callbacks.get('page_change'):
-                    self.callbacks['page_change'](1)
+                if self._cb_page_change:
+                    self._cb_page_change(1)
         
         elif button == 'menu':
             # Open main menu
             self.current_state = "MAIN_MENU"
             self.menu_index = 0
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self._emit_state(self.menu_index)
         
         elif button == 'back':
             # No function in reading mode
@@ -175,158 +362,136 @@ class FourButtonControls:
         if button == 'prev':
             # Navigate up
             self.menu_index = (self.menu_index - 1) % len(self.main_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self._emit_state(self.menu_index)
         
         elif button == 'next':
             # Navigate down
             self.menu_index = (self.menu_index + 1) % len(self.main_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self._emit_state(self.menu_index)
         
         elif button == 'menu':
             # Select menu item
-            selected = self.main_menu[self.menu_index]
-            
-            if selected == "Resume":
-                self.current_state = "READING"
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, 0)
-            
-            elif selected == "Jump Pages":
-                self.current_state = "JUMP_MENU"
-                self.submenu_index = 0
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.submenu_index)
-            
-            elif selected == "Skip to Chapter":
-                if self.chapter_menu:
-                    self.current_state = "CHAPTER_MENU"
-                    self.chapter_menu_index = 0
-                    if self.callbacks.get('state_changed'):
-                        self.callbacks['state_changed'](self.current_state, self.chapter_menu_index)
-                else:
-                    print("⚠️ No chapters found in this book")
-                    # Stay in main menu
-            
-            elif selected == "Refresh Book":
-                if self.callbacks.get('menu_action'):
-                    self.callbacks['menu_action']('refresh')
-            
-            elif selected == "Select Book":
-                self.current_state = "BROWSER_MENU"
-                self.browser_index = 0
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.browser_index)
-            
-            elif selected == "Sleep":
-                self.current_state = "SLEEP_MENU"
-                self.submenu_index = 0
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.submenu_index)
-            
-            elif selected == "Shutdown":
-                self.current_state = "SHUTDOWN_CONFIRM"
-                self.submenu_index = 0
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
+            self._main_menu_actions[self.menu_index]()
+
         elif button == 'back':
             # Back to reading
             self.current_state = "READING"
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, 0)
-    
-    def _handle_jump_menu(self, button, long_press):
-        """Handle buttons in jump menu"""
+            self._emit_state(0)
+
+    def _goto_reading(self):
+        self.current_state = "READING"
+        self._emit_state(0)
+
+    def _goto_jump(self):
+        self.current_state = "JUMP_MENU"
+        self.submenu_index = 0
+        self._emit_state(self.submenu_index)
+
+    def _goto_chapters(self):
+        if self.chapter_menu:
+            self.current_state = "CHAPTER_MENU"
+            self.chapter_menu_index = 0
+            self._emit_state(self.chapter_menu_index)
+        else:
+            print("⚠️ No chapters found in this book")
+            # Stay in main menu
+
+    def _do_refresh(self):
+        if self._cb_menu_action:
+            self._cb_menu_action('refresh')
+
+    def _goto_browser(self):
+        self.current_state = "BROWSER_MENU"
+        self.browser_index = 0
+        self._emit_state(self.browser_index)
+
+    def _goto_sleep(self):
+        self.current_state = "SLEEP_MENU"
+        self.submenu_index = 0
+        self._emit_state(self.submenu_index)
+
+    def _goto_shutdown(self):
+        self.current_state = "SHUTDOWN_CONFIRM"
+        self.submenu_index = 0
+        self._emit_state(self.submenu_index)
+
+    def _handle_list_menu(self, button, long_press):
+        """Shared handler for the jump, sleep, and shutdown submenus"""
+        menu_list, selections = self._submenu_defs[self.current_state]
+        return_index = self._return_idx[self.current_state]
+
         if button == 'prev':
             # Navigate up
-            self.submenu_index = (self.submenu_index - 1) % len(self.jump_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
+            self.submenu_index = (self.submenu_index - 1) % len(menu_list)
+            self._emit_state(self.submenu_index)
+
         elif button == 'next':
             # Navigate down
-            self.submenu_index = (self.submenu_index + 1) % len(self.jump_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
+            self.submenu_index = (self.submenu_index + 1) % len(menu_list)
+            self._emit_state(self.submenu_index)
+
         elif button == 'menu':
-            # Execute jump
-            selected = self.jump_menu[self.submenu_index]
-            
-            if selected == "Back":
-                self.current_state = "MAIN_MENU"
-                self.menu_index = 1  # Go back to Jump Pages in main menu
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.menu_index)
-            
-            else:
-                # Parse jump amount
-                if selected.startswith("+"):
-                    pages = int(selected[1:].split()[0])
-                    if self.callbacks.get('page_change'):
-                        self.callbacks['page_change'](pages)
-                elif selected.startswith("-"):
-                    pages = -int(selected[1:].split()[0])
-                    if self.callbacks.get('page_change'):
-                        self.callbacks['page_change'](pages)
-                
+            kind, value = selections[self.submenu_index]
+
+            if kind == 'jump':
+                if self._cb_page_change:
+                    self._cb_page_change(value)
                 # Return to reading
                 self.current_state = "READING"
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, 0)
-        
+                self._emit_state(0)
+
+            elif kind == 'action':
+                if self._cb_menu_action:
+                    self._cb_menu_action(value)
+
+            else:  # 'back' / Cancel
+                self.current_state = "MAIN_MENU"
+                self.menu_index = return_index
+                self._emit_state(self.menu_index)
+
         elif button == 'back':
             # Back to main menu
             self.current_state = "MAIN_MENU"
-            self.menu_index = 1  # Jump Pages position
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self.menu_index = return_index
+            self._emit_state(self.menu_index)
     
     def _handle_chapter_menu(self, button, long_press):
         """Handle buttons in chapter selection menu"""
         if not self.chapter_menu:
             self.current_state = "MAIN_MENU"
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self._emit_state(self.menu_index)
             return
         
         if button == 'prev':
             # Navigate up
             self.chapter_menu_index = (self.chapter_menu_index - 1) % len(self.chapter_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.chapter_menu_index)
+            self._emit_state(self.chapter_menu_index)
         
         elif button == 'next':
             # Navigate down
             self.chapter_menu_index = (self.chapter_menu_index + 1) % len(self.chapter_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.chapter_menu_index)
+            self._emit_state(self.chapter_menu_index)
         
         elif button == 'menu':
             # Select chapter
-            if self.callbacks.get('chapter_select'):
-                self.callbacks['chapter_select'](self.chapter_menu_index)
+            if self._cb_chapter_select:
+                self._cb_chapter_select(self.chapter_menu_index)
             
             # Return to reading
             self.current_state = "READING"
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, 0)
+            self._emit_state(0)
         
         elif button == 'back':
             # Back to main menu
             self.current_state = "MAIN_MENU"
-            self.menu_index = 2  # Skip to Chapter position
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self.menu_index = self._return_idx["CHAPTER_MENU"]
+            self._emit_state(self.menu_index)
     
     def _handle_browser_menu(self, button, long_press):
         """Handle buttons in book browser menu"""
         if not self.browser_menu:
             self.current_state = "MAIN_MENU"
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self._emit_state(self.menu_index)
             return
         
         items_per_page = 6
@@ -338,110 +503,50 @@ class FourButtonControls:
             self.browser_index = (self.browser_index - 1) % total_items
             # Update page if needed
             self.browser_page = self.browser_index // items_per_page
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.browser_index)
+            self._emit_state(self.browser_index)
         
         elif button == 'next':
             # Navigate down
             self.browser_index = (self.browser_index + 1) % total_items
             # Update page if needed
             self.browser_page = self.browser_index // items_per_page
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.browser_index)
+            self._emit_state(self.browser_index)
         
         elif button == 'menu':
             # Select book
             if self.browser_index == 0:
                 # "Back to Reading" selected
                 self.current_state = "READING"
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, 0)
+                self._emit_state(0)
             else:
                 # Book selected
-                if self.callbacks.get('book_select'):
+                if self._cb_book_select:
                     book_index = self.browser_index - 1  # Adjust for "Back to Reading"
                     if book_index < len(self.browser_menu) - 1:
-                        self.callbacks['book_select'](book_index)
+                        self._cb_book_select(book_index)
         
         elif button == 'back':
             # Back to main menu
             self.current_state = "MAIN_MENU"
-            self.menu_index = 3  # Select Book position
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
-    
-    def _handle_sleep_menu(self, button, long_press):
-        """Handle buttons in sleep menu"""
-        if button == 'prev':
-            # Navigate up
-            self.submenu_index = (self.submenu_index - 1) % len(self.sleep_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
-        elif button == 'next':
-            # Navigate down
-            self.submenu_index = (self.submenu_index + 1) % len(self.sleep_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
-        elif button == 'menu':
-            selected = self.sleep_menu[self.submenu_index]
-            
-            if selected == "Sleep Now":
-                if self.callbacks.get('menu_action'):
-                    self.callbacks['menu_action']('sleep')
-            elif selected == "Cancel":
-                self.current_state = "MAIN_MENU"
-                self.menu_index = 4  # Sleep position
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.menu_index)
-        
-        elif button == 'back':
-            # Back to main menu
-            self.current_state = "MAIN_MENU"
-            self.menu_index = 4  # Sleep position
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
-    
-    def _handle_shutdown_menu(self, button, long_press):
-        """Handle buttons in shutdown menu"""
-        if button == 'prev':
-            # Navigate up
-            self.submenu_index = (self.submenu_index - 1) % len(self.shutdown_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
-        elif button == 'next':
-            # Navigate down
-            self.submenu_index = (self.submenu_index + 1) % len(self.shutdown_menu)
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.submenu_index)
-        
-        elif button == 'menu':
-            selected = self.shutdown_menu[self.submenu_index]
-            
-            if selected == "Shutdown Now":
-                if self.callbacks.get('menu_action'):
-                    self.callbacks['menu_action']('shutdown')
-            elif selected == "Cancel":
-                self.current_state = "MAIN_MENU"
-                self.menu_index = 5  # Shutdown position
-                if self.callbacks.get('state_changed'):
-                    self.callbacks['state_changed'](self.current_state, self.menu_index)
-        
-        elif button == 'back':
-            # Back to main menu
-            self.current_state = "MAIN_MENU"
-            self.menu_index = 5  # Shutdown position
-            if self.callbacks.get('state_changed'):
-                self.callbacks['state_changed'](self.current_state, self.menu_index)
+            self.menu_index = self._return_idx["BROWSER_MENU"]
+            self._emit_state(self.menu_index)
     
     def register_callback(self, event, callback):
-        """Register a callback function"""
-        self.callbacks[event] = callback
+        """Register a callback function
+
+        Lock-free by design: the setattr is an atomic reference
+        replacement, so the monitor thread never observes a partial
+        update (see the callback notes in __init__).
+        """
+        setattr(self, '_cb_' + event, callback)
     
     def cleanup(self):
         """Cleanup GPIO"""
-        self.running = False
-        time.sleep(0.1)
+        if self._edge_driven:
+            for pin in self._pin_to_name:
+                GPIO.remove_event_detect(pin)
+        else:
+            self._stop.set()
+            if self._monitor_thread:
+                self._monitor_thread.join(0.2)
         GPIO.cleanup()
\ No newline at end of file
@@ -5,6 +5,9 @@ import sys
 import os
 import datetime
 import textwrap
+import queue
+import threading
+from collections import OrderedDict
 sys.path.append("/home/colbeigh/e-Paper/RaspberryPi_JetsonNano/python/lib")
 
 from waveshare_epd import epd4in2_V2
@@ -12,6 +15,20 @@ from PIL import Image, ImageDraw
 import config
 from fonts import FastFontCache
 
+# NumPy packs the framebuffer in C; fall back to the vendor's Python loop
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# JIT-compiled pack kernel, preferred over packbits when numba is present
+try:
+    import fast_frame
+    FAST_FRAME_AVAILABLE = fast_frame.NUMBA_AVAILABLE
+except ImportError:
+    FAST_FRAME_AVAILABLE = False
+
 class EReaderDisplay:
     def __init__(self):
         self.epd = epd4in2_V2.EPD()
@@ -22,6 +39,60 @@ class EReaderDisplay:
         self.page_counter = 0
         self.full_refresh_interval = config.FULL_REFRESH_INTERVAL
         self._display_initialized = False
+        self._bg_cache = {}  # Static chrome layers, keyed per screen
+        self._last_state_hash = None  # Semantic state of the last pushed frame
+        self._page_img_cache = OrderedDict()  # LRU of rendered reading pages
+        self._page_img_cache_size = 8
+        self._confirm_wrap_cache = {}  # message -> [(line, width)]
+
+        # Fixed row geometry for the menu renderers: (highlight rect,
+        # text xy) per visible slot, plus a memo for truncated labels
+        menu_margin = 10
+        W = config.DISPLAY_WIDTH
+        n_slots = max(len(config.MAIN_MENU), len(config.JUMP_MENU))
+        self._menu_slots = [((menu_margin - 5, y - 5, W - menu_margin + 5, y + 25),
+                             (menu_margin, y))
+                            for y in range(menu_margin + 50,
+                                           menu_margin + 50 + n_slots * 35, 35)]
+        self._truncate_cache = {}
+        # Extra spacing so multiline_text lands rows on the 35px slot grid;
+        # computed from PIL's own line metric on first menu render
+        self._menu_spacing = None
+
+        # Two reusable canvases, flipped each frame so the next render
+        # never scribbles on the image a worker may still be packing from
+        H = config.DISPLAY_HEIGHT
+        self._scratch = (Image.new("1", (W, H), 255), Image.new("1", (W, H), 255))
+        self._scratch_draw = (ImageDraw.Draw(self._scratch[0]),
+                              ImageDraw.Draw(self._scratch[1]))
+        self._scratch_cur = 0
+
+        # Empty progress-bar track, drawn once and pasted per reading page
+        # (201x3: the outline rectangle spans 200px inclusive)
+        self._progress_track = Image.new("1", (201, 3), 255)
+        ImageDraw.Draw(self._progress_track).rectangle((0, 0, 200, 2),
+                                                       outline=0, fill=255)
+
+        # Validated fast pack layout, probed once against epd.getbuffer on
+        # the first packed frame. _pack_transform is the PIL transpose the
+        # vendor packer applies to our frames (the panel RAM is landscape
+        # while the UI renders portrait); None means frames are already
+        # panel-major. _pack_ok False means nothing matched and every
+        # frame goes through the vendor packer.
+        self._pack_ok = None
+        self._pack_transform = None
+
+        # Reused output buffer for the pack kernel, one bit per pixel
+        if NUMPY_AVAILABLE:
+            self._fb_buf = np.empty(
+                config.DISPLAY_WIDTH * config.DISPLAY_HEIGHT // 8, dtype=np.uint8)
+
+        # Partial refreshes drain through a single-slot queue on a worker
+        # thread so the UI thread doesn't block on the SPI transfer; the
+        # lock keeps sleep()/wake() from racing an in-flight write
+        self._epd_lock = threading.Lock()
+        self._refresh_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._refresh_worker, daemon=True).start()
         
         # Fonts
         self.title_font = FastFontCache.get_font(config.FONT_SIZE_TITLE)
@@ -33,11 +104,66 @@ class EReaderDisplay:
         """Initialize display"""
         if not self._display_initialized:
             self.epd.init()
+            self._tune_spi()
             self._display_initialized = True
+            self._warm_pack_kernel()
+
+    def _tune_spi(self):
+        """Raise the SPI clock and batch send_data into single transfers
+
+        The vendor driver initialises SPI at a conservative rate and sends
+        framebuffer bytes one writebytes call each. Called after every
+        epd.init() since module_init resets the clock. Best effort: any
+        failure leaves the stock driver behavior in place.
+        """
+        try:
+            from waveshare_epd import epdconfig
+            spi = getattr(epdconfig.implementation, 'SPI', None)
+            if spi is None:
+                return
+            spi.max_speed_hz = 20000000
+
+            epd = self.epd
+
+            def _send_data_fast(data):
+                epdconfig.digital_write(epd.dc_pin, 1)
+                epdconfig.digital_write(epd.cs_pin, 0)
+                if isinstance(data, (bytes, bytearray, list)):
+                    spi.writebytes2(data)
+                else:
+                    spi.writebytes([data])
+                epdconfig.digital_write(epd.cs_pin, 1)
+
+            epd.send_data = _send_data_fast
+            epd.send_data2 = _send_data_fast
+            if not getattr(self, '_spi_tuned', False):
+                self._spi_tuned = True
+                print("✅ SPI fast path: 20 MHz, batched transfers")
+        except Exception as e:
+            print(f"⚠️ SPI fast path unavailable: {e}")
+
+    def _warm_pack_kernel(self):
+        """Trigger the numba JIT once so the first page turn isn't delayed"""
+        if FAST_FRAME_AVAILABLE:
+            W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+            # Warm in whichever orientation has a byte-aligned width; the
+            # probed pack layout rotates frames to that orientation too
+            pw, ph = (W, H) if W % 8 == 0 else (H, W)
+            if pw % 8 == 0:
+                blank = np.ones(pw * ph, dtype=np.uint8)
+                fast_frame.pack_mono(blank, self._fb_buf, pw // 8, ph)
     
     def clear_display(self):
         """Clear display completely"""
+        # Under the EPD lock so a direct call can't race the refresh
+        # worker's display_Partial mid-transfer
+        with self._epd_lock:
+            self._clear_display_locked()
+
+    def _clear_display_locked(self):
+        """Clear with _epd_lock already held (display_page's full path)"""
         self.epd.init()
+        self._tune_spi()
         self.epd.Clear()
         self.needs_clear = False
         self.page_counter = 0
@@ -51,16 +177,103 @@ class EReaderDisplay:
             return True
         return False
     
+    def _acquire_canvas(self):
+        """Return the next scratch (img, draw) pair, cleared to white
+
+        Reusing two fixed canvases avoids a 400x300 allocation per frame;
+        the rectangle clear is a memset inside libImaging.
+        """
+        self._scratch_cur ^= 1
+        img = self._scratch[self._scratch_cur]
+        draw = self._scratch_draw[self._scratch_cur]
+        return img, draw
+
+    def _acquire_cleared_canvas(self):
+        """Scratch canvas cleared to white (the clear is a libImaging memset)"""
+        img, draw = self._acquire_canvas()
+        draw.rectangle((0, 0, img.width, img.height), fill=255)
+        return img, draw
+
+    def _get_menu_spacing(self, draw):
+        """Spacing that makes multiline_text advance exactly 35px per row
+
+        multiline_text steps by textbbox("A") height plus spacing, so
+        deriving the spacing from the same metric keeps the batched rows
+        aligned with the _menu_slots highlight rectangles.
+        """
+        if self._menu_spacing is None:
+            row_h = draw.textbbox((0, 0), "A", font=self.menu_font)[3]
+            self._menu_spacing = 35 - row_h
+        return self._menu_spacing
+
+    def clear_page_cache(self):
+        """Drop cached reading-page bitmaps; call whenever pagination changes
+
+        The cache is keyed by id(pages), and a replaced list's id can be
+        reused by the allocator, so stale entries must not outlive the
+        list they were rendered from.
+        """
+        self._page_img_cache.clear()
+
+    def _truncate(self, text, limit):
+        """Memoized label truncation for menu items"""
+        key = (text, limit)
+        cached = self._truncate_cache.get(key)
+        if cached is None:
+            cached = text if len(text) <= limit else text[:limit - 3] + "..."
+            self._truncate_cache[key] = cached
+        return cached
+
+    def _build_static_bg(self, key, title, instructions=None, divider=True, margin=10):
+        """Return a scratch (img, draw) pair seeded with the cached static
+        chrome (title, divider, instructions), rendering it once on first use"""
+        cached = self._bg_cache.get(key)
+        if cached is None:
+            W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+            cached = Image.new("1", (W, H), 255)
+            draw = ImageDraw.Draw(cached)
+
+            title_width = FastFontCache.get_length(self.title_font, title)
+            draw.text((W//2 - title_width//2, margin), title, font=self.title_font, fill=0)
+            if divider:
+                draw.line((margin, margin + 30, W - margin, margin + 30), fill=0, width=2)
+            if instructions:
+                inst_width = FastFontCache.get_length(self.small_font, instructions)
+                draw.text((W//2 - inst_width//2, H - 30), instructions, font=self.small_font, fill=0)
+
+            self._bg_cache[key] = cached
+
+        # Paste onto a scratch canvas rather than copying a fresh image
+        img, draw = self._acquire_canvas()
+        img.paste(cached, (0, 0))
+        return img, draw
+
     def render_reading_page(self, font, pages, page_index, margin=config.DISPLAY_MARGIN):
         """Render a normal reading page"""
         W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
-        img = Image.new("1", (W, H), 255)
-        draw = ImageDraw.Draw(img)
-        
-        bbox = font.getbbox("Hg")
-        line_height = bbox[3] + 1
-        font_height = bbox[3]
-        
+
+        line_height = FastFontCache.get_line_height(font)
+        font_height = line_height - 1
+
+        # Recently rendered pages are served from the LRU cache; only the
+        # footer clock needs redrawing on a hit
+        cache_key = (id(pages), page_index)
+        cached = self._page_img_cache.get(cache_key)
+        if cached is not None:
+            self._page_img_cache.move_to_end(cache_key)
+            img, draw = self._acquire_canvas()
+            img.paste(cached, (0, 0))
+            if self.show_time:
+                footer_y = H - margin - font_height
+                draw.rectangle((margin, footer_y - 2, margin + 60,
+                                footer_y + font_height), fill=255)
+                current_time = datetime.datetime.now().strftime("%H:%M")
+                draw.text((margin, footer_y - 2), current_time, font=font, fill=0)
+            self.current_image = img
+            return img
+
+        img, draw = self._acquire_cleared_canvas()
+
         # Draw text content
         y = margin
         footer_margin = font_height * 2.5
@@ -85,7 +298,7 @@ class EReaderDisplay:
         
         # Page number (right)
         page_info = f"{page_index+1}/{len(pages)}"
-        page_width = font.getlength(page_info)
+        page_width = FastFontCache.measure(font, page_info)
         draw.text((W - margin - page_width, footer_y - 2), page_info, font=font, fill=0)
         
         # Progress bar
@@ -94,166 +307,125 @@ class EReaderDisplay:
         bar_x = (W - bar_width) // 2
         bar_y = H - margin - font_height - 8
         bar_filled = int(bar_width * progress)
-        draw.rectangle((bar_x, bar_y, bar_x + bar_width, bar_y + 2), outline=0, fill=255)
+        img.paste(self._progress_track, (bar_x, bar_y))
         if bar_filled > 0:
             draw.rectangle((bar_x, bar_y, bar_x + bar_filled, bar_y + 2), fill=0)
-        
+
+        self._page_img_cache[cache_key] = img.copy()
+        if len(self._page_img_cache) > self._page_img_cache_size:
+            self._page_img_cache.popitem(last=False)
+
         self.current_image = img
         return img
     
     def render_menu(self, title, items, selected_index, margin=10):
         """Render a generic menu"""
         W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
-        img = Image.new("1", (W, H), 255)
-        draw = ImageDraw.Draw(img)
-        
-        # Title
-        title_width = self.title_font.getlength(title)
-        draw.text((W//2 - title_width//2, margin), title, font=self.title_font, fill=0)
-        draw.line((margin, margin + 30, W - margin, margin + 30), fill=0, width=2)
-        
-        # Menu items
-        y = margin + 50
-        for i, item in enumerate(items):
-            # Truncate long items
-            display_item = item
-            if len(item) > 30:
-                display_item = item[:27] + "..."
-            
-            # Highlight selected item
-            if i == selected_index:
-                # Draw selection background
-                draw.rectangle((margin-5, y-5, W-margin+5, y+25), fill=0)
-                draw.text((margin, y), f"▶ {display_item}", font=self.menu_font, fill=255)
-            else:
-                draw.text((margin + 20, y), display_item, font=self.menu_font, fill=0)
-            
-            y += 35
-        
-        # Instructions at bottom
-        instructions = "Prev/Next: Navigate  Menu: Select  Back: Cancel"
-        inst_width = self.small_font.getlength(instructions)
-        draw.text((W//2 - inst_width//2, H - 30), instructions, font=self.small_font, fill=0)
-        
+        img, draw = self._build_static_bg(
+            ('menu', title), title,
+            "Prev/Next: Navigate  Menu: Select  Back: Cancel", margin=margin)
+
+        # Menu items: one batched text call, then the selected row drawn
+        # white over its highlight rectangle
+        texts = [self._truncate(item, 30) for item in items]
+        x0, y0 = self._menu_slots[0][1]
+
+        draw.multiline_text((x0 + 20, y0), "\n".join(texts), font=self.menu_font,
+                            fill=0, spacing=self._get_menu_spacing(draw))
+        # Guarded like render_browser_menu: a selection past the slot table
+        # must not raise in the button-callback thread
+        if 0 <= selected_index < min(len(texts), len(self._menu_slots)):
+            rect, xy = self._menu_slots[selected_index]
+            draw.rectangle(rect, fill=0)
+            draw.text(xy, f"▶ {texts[selected_index]}",
+                      font=self.menu_font, fill=255)
+
         self.current_image = img
         return img
-    
+
     def render_chapter_menu(self, chapters, selected_index, margin=10):
         """Render chapter selection menu"""
         W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
-        img = Image.new("1", (W, H), 255)
-        draw = ImageDraw.Draw(img)
-        
-        # Title
-        title = "CHAPTERS"
-        title_width = self.title_font.getlength(title)
-        draw.text((W//2 - title_width//2, margin), title, font=self.title_font, fill=0)
-        draw.line((margin, margin + 30, W - margin, margin + 30), fill=0, width=2)
-        
-        # Chapter items
-        y = margin + 50
+        img, draw = self._build_static_bg(
+            ('chapter_menu',), "CHAPTERS",
+            "Menu: Select  Back: Cancel", margin=margin)
+
+        # Chapter items, batched like render_menu
         items_per_page = 6
         start_index = (selected_index // items_per_page) * items_per_page
-        
-        for i in range(start_index, min(start_index + items_per_page, len(chapters))):
-            chapter = chapters[i]
-            # Truncate long chapter titles
-            display_chapter = chapter
-            if len(chapter) > 25:
-                display_chapter = chapter[:22] + "..."
-            
-            # Add numbering
-            display_text = f"{i+1}. {display_chapter}"
-            
-            # Highlight selected item
-            if i == selected_index:
-                draw.rectangle((margin-5, y-5, W-margin+5, y+25), fill=0)
-                draw.text((margin, y), display_text, font=self.menu_font, fill=255)
-            else:
-                draw.text((margin, y), display_text, font=self.menu_font, fill=0)
-            
-            y += 35
+        end_index = min(start_index + items_per_page, len(chapters))
+
+        texts = [f"{i+1}. {self._truncate(chapters[i], 25)}"
+                 for i in range(start_index, end_index)]
+        sel_slot = selected_index - start_index
+        rect, xy = self._menu_slots[sel_slot]
+
+        draw.rectangle(rect, fill=0)
+        draw.multiline_text(self._menu_slots[0][1], "\n".join(texts),
+                            font=self.menu_font, fill=0,
+                            spacing=self._get_menu_spacing(draw))
+        draw.text(xy, texts[sel_slot], font=self.menu_font, fill=255)
         
         # Page indicator
         total_pages = (len(chapters) + items_per_page - 1) // items_per_page
         current_page = start_index // items_per_page + 1
         if total_pages > 1:
             page_indicator = f"Page {current_page}/{total_pages}"
-            page_width = self.small_font.getlength(page_indicator)
+            page_width = FastFontCache.measure(self.small_font, page_indicator)
             draw.text((W//2 - page_width//2, H - 50), page_indicator, font=self.small_font, fill=0)
-        
-        # Instructions
-        instructions = "Menu: Select  Back: Cancel"
-        inst_width = self.small_font.getlength(instructions)
-        draw.text((W//2 - inst_width//2, H - 30), instructions, font=self.small_font, fill=0)
-        
+
         self.current_image = img
         return img
-    
+
     def render_browser_menu(self, books, selected_index, current_page, margin=10):
         """Render book browser menu"""
         W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
-        img = Image.new("1", (W, H), 255)
-        draw = ImageDraw.Draw(img)
-        
-        # Title
-        title = "SELECT BOOK"
-        title_width = self.title_font.getlength(title)
-        draw.text((W//2 - title_width//2, margin), title, font=self.title_font, fill=0)
-        draw.line((margin, margin + 30, W - margin, margin + 30), fill=0, width=2)
-        
-        # Book items (paginated)
-        y = margin + 50
+        img, draw = self._build_static_bg(
+            ('browser_menu',), "SELECT BOOK",
+            "Menu: Select  Back: Cancel", margin=margin)
+
+        # Book items (paginated), batched like render_menu
         items_per_page = 6
         start_index = current_page * items_per_page
         end_index = min(start_index + items_per_page, len(books))
-        
-        for i in range(start_index, end_index):
-            book_name = books[i]
-            # Truncate long book names
-            display_book = book_name
-            if len(book_name) > 25:
-                display_book = book_name[:22] + "..."
-            
-            # Highlight selected item
-            if i == selected_index:
-                draw.rectangle((margin-5, y-5, W-margin+5, y+25), fill=0)
-                draw.text((margin, y), f"▶ {display_book}", font=self.menu_font, fill=255)
-            else:
-                draw.text((margin + 20, y), display_book, font=self.menu_font, fill=0)
-            
-            y += 35
+
+        texts = [self._truncate(books[i], 25) for i in range(start_index, end_index)]
+        sel_slot = selected_index - start_index
+        x0, y0 = self._menu_slots[0][1]
+
+        draw.multiline_text((x0 + 20, y0), "\n".join(texts), font=self.menu_font,
+                            fill=0, spacing=self._get_menu_spacing(draw))
+        if 0 <= sel_slot < len(texts):
+            rect, xy = self._menu_slots[sel_slot]
+            draw.rectangle(rect, fill=0)
+            draw.text(xy, f"▶ {texts[sel_slot]}", font=self.menu_font, fill=255)
         
         # Page indicator
         total_pages = (len(books) + items_per_page - 1) // items_per_page
         if total_pages > 1:
             page_indicator = f"Page {current_page + 1}/{total_pages}"
-            page_width = self.small_font.getlength(page_indicator)
+            page_width = FastFontCache.measure(self.small_font, page_indicator)
             draw.text((W//2 - page_width//2, H - 50), page_indicator, font=self.small_font, fill=0)
-        
-        # Instructions
-        instructions = "Menu: Select  Back: Cancel"
-        inst_width = self.small_font.getlength(instructions)
-        draw.text((W//2 - inst_width//2, H - 30), instructions, font=self.small_font, fill=0)
-        
+
         self.current_image = img
         return img
-    
+
     def render_confirmation(self, title, message, options, selected_index, margin=10):
         """Render confirmation dialog"""
         W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
-        img = Image.new("1", (W, H), 255)
-        draw = ImageDraw.Draw(img)
-        
-        # Title
-        title_width = self.title_font.getlength(title)
-        draw.text((W//2 - title_width//2, margin), title, font=self.title_font, fill=0)
-        
-        # Message
+        img, draw = self._build_static_bg(('confirm', title), title,
+                                          divider=False, margin=margin)
+
+        # Message, wrapped and measured once per distinct string since
+        # confirmations re-render every loop tick while on screen
         y = margin + 50
-        msg_lines = textwrap.wrap(message, width=30)
-        for line in msg_lines:
-            draw.text((W//2 - self.menu_font.getlength(line)//2, y), line, font=self.menu_font, fill=0)
+        wrapped = self._confirm_wrap_cache.get(message)
+        if wrapped is None:
+            wrapped = [(line, int(FastFontCache.get_length(self.menu_font, line)))
+                       for line in textwrap.wrap(message, width=30)]
+            self._confirm_wrap_cache[message] = wrapped
+        for line, line_width in wrapped:
+            draw.text((W//2 - line_width//2, y), line, font=self.menu_font, fill=0)
             y += 30
         
         # Options
@@ -271,33 +443,217 @@ class EReaderDisplay:
         self.current_image = img
         return img
     
-    def display_page(self, img, force_full=False):
-        """Display page with appropriate refresh"""
+    def _probe_pack_layout(self, img):
+        """Find a raw mode-1 packing that reproduces the vendor packer
+
+        The vendor getbuffer rotates frames whose size is the transpose
+        of the panel's (portrait UI on a landscape panel), so try the
+        identity and both 90° transposes and keep whichever matches its
+        bytes exactly. Returns (ok, transform); ok False means no fast
+        layout is safe and every frame uses the vendor packer.
+        """
+        try:
+            vendor = bytes(self.epd.getbuffer(img))
+            for transform in (None, Image.ROTATE_90, Image.ROTATE_270):
+                candidate = img if transform is None else img.transpose(transform)
+                if candidate.tobytes("raw", "1") == vendor:
+                    return True, transform
+        except Exception:
+            pass
+        print("⚠️ No packer matches the vendor layout, using epd.getbuffer")
+        return False, None
+
+    def _fast_getbuffer(self, img):
+        """Pack a full-size mode-1 frame into panel bytes in C
+
+        The panel layout is row-major, MSB-first, one bit per pixel with
+        white = 1, possibly rotated 90° from the UI frame — exactly what
+        PIL's raw "1" encoder produces from the transposed image, without
+        the vendor driver's per-pixel Python loop. The layout is proven
+        against epd.getbuffer on the first frame; anything unproven falls
+        back to the vendor packer.
+        """
+        W, H = config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT
+        if img.mode == "1" and img.size == (W, H):
+            if self._pack_ok is None:
+                self._pack_ok, self._pack_transform = self._probe_pack_layout(img)
+            if self._pack_ok:
+                if self._pack_transform is not None:
+                    img = img.transpose(self._pack_transform)
+                pw, ph = img.size
+                if FAST_FRAME_AVAILABLE and pw % 8 == 0:
+                    # Same bytes as the validated tobytes layout (MSB-first
+                    # rows, white = 1), packed by the JIT kernel straight
+                    # into the reused buffer
+                    flat = np.asarray(img, dtype=np.uint8).ravel()
+                    fast_frame.pack_mono(flat, self._fb_buf, pw // 8, ph)
+                    return bytearray(self._fb_buf.tobytes())
+                return bytearray(img.tobytes("raw", "1"))
+        return self.epd.getbuffer(img)
+
+    def display_page(self, img, force_full=False, state_key=None):
+        """Display page with appropriate refresh
+
+        state_key is the caller's semantic state for this frame; when it
+        matches the last pushed frame the panel already shows the same
+        pixels, so the transfer is skipped entirely.
+        """
+        if (state_key is not None and state_key == self._last_state_hash
+                and not (self.needs_clear or force_full)):
+            return True
+
         periodic_full = self.check_full_refresh_needed()
         needs_full = self.needs_clear or force_full or periodic_full
-        
+        self._last_state_hash = state_key
+
         if needs_full:
             if periodic_full:
                 print("🔄 Periodic full refresh")
-            self.clear_display()
-            self.epd.display(self.epd.getbuffer(img))
+            # Drop any partial frame still queued; the worker would push
+            # it after this full refresh and put a stale frame on screen
+            try:
+                self._refresh_q.get_nowait()
+            except queue.Empty:
+                pass
+            with self._epd_lock:
+                self._clear_display_locked()
+                self.epd.display(self._fast_getbuffer(img))
             return False
-        
+
         if self.use_partial:
+            # Hand the packed buffer to the refresh worker; a frame still
+            # waiting in the slot is stale, so replace it
+            buf = self._fast_getbuffer(img)
             try:
-                self.epd.display_Partial(self.epd.getbuffer(img))
-                return True
-            except:
-                self.epd.display(self.epd.getbuffer(img))
-                return False
+                self._refresh_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._refresh_q.put((buf, False))
+            return True
         else:
-            self.epd.display(self.epd.getbuffer(img))
+            with self._epd_lock:
+                self.epd.display(self._fast_getbuffer(img))
             return False
+
+    def _set_epd_window(self, x0, y0, x1, y1):
+        """Program the controller's RAM window (SSD1683 0x44/0x45/0x4E/0x4F)
+
+        X addresses count in bytes; callers pass pixel coordinates already
+        aligned to byte boundaries.
+        """
+        epd = self.epd
+        epd.send_command(0x44)  # X start/end, byte units
+        epd.send_data(x0 // 8)
+        epd.send_data(x1 // 8 - 1)
+        epd.send_command(0x45)  # Y start/end
+        epd.send_data(y0 & 0xFF)
+        epd.send_data((y0 >> 8) & 0x01)
+        epd.send_data((y1 - 1) & 0xFF)
+        epd.send_data(((y1 - 1) >> 8) & 0x01)
+        epd.send_command(0x4E)  # X counter
+        epd.send_data(x0 // 8)
+        epd.send_command(0x4F)  # Y counter
+        epd.send_data(y0 & 0xFF)
+        epd.send_data((y0 >> 8) & 0x01)
+
+    def _panel_rect(self, img, rect):
+        """Map an image-space rect into panel RAM space via the pack transform"""
+        x0, y0, x1, y1 = rect
+        transform = self._pack_transform
+        if transform == Image.ROTATE_90:
+            return y0, img.width - x1, y1, img.width - x0
+        if transform == Image.ROTATE_270:
+            return img.height - y1, x0, img.height - y0, x1
+        return x0, y0, x1, y1
+
+    def _display_partial_window(self, img, rect):
+        """Write only the given rectangle to panel RAM and refresh
+
+        rect is in image coordinates; the controller RAM may be rotated
+        90° from the UI frame, so the window and the cropped pixels both
+        go through the transform the validated packer applies.
+        """
+        if self._pack_ok is None:
+            # Probe the pack layout so the window math knows the rotation
+            self._fast_getbuffer(img)
+        if not self._pack_ok:
+            raise RuntimeError("no validated panel layout for windowed writes")
+
+        panel = (img if self._pack_transform is None
+                 else img.transpose(self._pack_transform))
+        PW, PH = panel.size
+        x0, y0, x1, y1 = self._panel_rect(img, rect)
+        # Widen to byte boundaries and clamp to the panel
+        x0 = max(0, x0) & ~7
+        x1 = min(PW, (x1 + 7) & ~7)
+        y0 = max(0, y0)
+        y1 = min(PH, y1)
+
+        buf = panel.crop((x0, y0, x1, y1)).tobytes("raw", "1")
+        epd = self.epd
+
+        self._set_epd_window(x0, y0, x1, y1)
+        epd.send_command(0x24)  # Write RAM
+        send_buf = getattr(epd, 'send_data2', None)
+        if send_buf is not None:
+            send_buf(bytearray(buf))
+        else:
+            for byte in buf:
+                epd.send_data(byte)
+
+        epd.send_command(0x22)  # Display update control
+        epd.send_data(0xFF)
+        epd.send_command(0x20)  # Activate
+        epd.ReadBusy()
+
+        # Restore the full-panel window for subsequent refreshes
+        self._set_epd_window(0, 0, PW, PH)
+
+    def display_page_region(self, img, rect):
+        """Push only rect to the panel; ~20x fewer bytes for a clock tick
+
+        Falls back to the regular display_page path if the windowed write
+        fails (driver internals differ) or a full refresh is pending.
+        """
+        if not self.use_partial or self.needs_clear:
+            return self.display_page(img)
+        try:
+            with self._epd_lock:
+                self._display_partial_window(img, rect)
+            self.current_image = img
+            return True
+        except Exception as e:
+            print(f"⚠️ Windowed update failed ({e}), using full partial")
+            return self.display_page(img)
+
+    def _refresh_worker(self):
+        """Drain queued frames to the panel off the UI thread"""
+        while True:
+            buf, is_full = self._refresh_q.get()
+            try:
+                with self._epd_lock:
+                    if is_full:
+                        self.epd.display(buf)
+                    else:
+                        try:
+                            self.epd.display_Partial(buf)
+                        except:
+                            self.epd.display(buf)
+            except Exception as e:
+                print(f"⚠️ Display refresh failed: {e}")
     
     def sleep(self):
         """Put display to sleep"""
-        self.epd.sleep()
-    
+        # Drop any frame still queued so it can't display after wake
+        try:
+            self._refresh_q.get_nowait()
+        except queue.Empty:
+            pass
+        with self._epd_lock:
+            self.epd.sleep()
+
     def wake(self):
         """Wake display from sleep"""
-        self.epd.init()
\ No newline at end of file
+        with self._epd_lock:
+            self.epd.init()
+            self._tune_spi()
\ No newline at end of file
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+# fast_frame.py - JIT-compiled framebuffer packing
+
+# Numba compiles the pack loop to native code; cache=True keeps the
+# compiled kernel on disk so only the very first run pays for compilation
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def pack_mono(flat_u8, out, w_bytes, h):
+        """Pack row-major 0/1 pixels into MSB-first panel bytes (white = 1)"""
+        for y in prange(h):
+            row = y * w_bytes * 8
+            for xb in range(w_bytes):
+                b = 0
+                base = row + xb * 8
+                for k in range(8):
+                    b = (b << 1) | (flat_u8[base + k] & 1)
+                out[y * w_bytes + xb] = b
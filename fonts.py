@@ -7,7 +7,65 @@ import config
 
 class FastFontCache:
     _cache = {}
-    
+    _advance_cache = {}
+    _metrics_cache = {}
+    _length_cache = {}
+
+    @staticmethod
+    def get_line_height(font):
+        """Line height for a font, measured once via getbbox("Hg")"""
+        cache_key = id(font)
+
+        if cache_key not in FastFontCache._metrics_cache:
+            FastFontCache._metrics_cache[cache_key] = font.getbbox("Hg")[3] + 1
+
+        return FastFontCache._metrics_cache[cache_key]
+
+    @staticmethod
+    def get_length(font, text):
+        """Memoized font.getlength for strings rendered repeatedly"""
+        cache_key = (id(font), text)
+
+        if cache_key not in FastFontCache._length_cache:
+            FastFontCache._length_cache[cache_key] = font.getlength(text)
+
+        return FastFontCache._length_cache[cache_key]
+
+    @staticmethod
+    def get_advance_table(font):
+        """Per-glyph advance widths for ASCII (index by ord, 0 for control chars)"""
+        cache_key = id(font)
+
+        if cache_key not in FastFontCache._advance_cache:
+            table = [0.0] * 128
+            for code in range(32, 127):
+                table[code] = font.getlength(chr(code))
+            FastFontCache._advance_cache[cache_key] = table
+
+        return FastFontCache._advance_cache[cache_key]
+
+    _glyph_adv = {}
+
+    @staticmethod
+    def measure(font, text):
+        """Approximate string width as a sum of cached per-glyph advances
+
+        Skips a full FreeType shaping call per string; suited to dynamic
+        strings (page numbers, indicators) whose exact kerning doesn't
+        matter. Use get_length where the shaped width must be exact.
+        """
+        total = 0.0
+        cache = FastFontCache._glyph_adv
+        font_id = id(font)
+        for ch in text:
+            key = (font_id, ch)
+            width = cache.get(key)
+            if width is None:
+                width = font.getlength(ch)
+                cache[key] = width
+            total += width
+        return total
+
     @staticmethod
     def get_font(size=config.FONT_SIZE_NORMAL):
         cache_key = (config.FONT_PATH, size)
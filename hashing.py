@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+# hashing.py - Fast non-cryptographic hashing for file-identity keys
+
+import hashlib
+
+# These hashes only name cache/bookmark files, so a fast non-crypto hash
+# is fine; fall back to md5 (the historical scheme) when xxhash is missing
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+def fast_hash(s):
+    """16-char hex digest used for cache and bookmark file names"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(s.encode())
+    return hashlib.md5(s.encode()).hexdigest()[:16]
+
+def legacy_hash(s):
+    """The original md5-based digest, kept for reading old files"""
+    return hashlib.md5(s.encode()).hexdigest()[:16]
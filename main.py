@@ -5,12 +5,14 @@ import sys
 import os
 import time
 import datetime
+import threading
 import subprocess
 
 # Import modules
 import config
 from fonts import FastFontCache
-from book import extract_text_fast
+from hashing import fast_hash
+from book import extract_text_fast, check_processing_complete
 from bookmarks import BookmarkManager
 from controls import FourButtonControls
 from display import EReaderDisplay
@@ -37,6 +39,25 @@ class CompleteEReader:
         # Books list
         self.all_books = []
         self.book_filenames = []
+
+        # Wakes the run loop when a button callback fires, so it can idle
+        # between scheduled timer checks instead of ticking at 10 Hz
+        self._wake_event = threading.Event()
+
+        # Page-change coalescing: a burst of deltas from a held button is
+        # merged and rendered once. The lock covers the accumulate and the
+        # flush's read-and-zero, which run on different threads
+        self._pending_delta = 0
+        self._pending_timer = None
+        self._pending_lock = threading.Lock()
+
+        # Renders happen on three threads (button callbacks, the run loop
+        # and the page-flush timer); the display's scratch canvases are
+        # shared, so render-and-push must be serialized
+        self._render_lock = threading.Lock()
+
+        # book_path -> derived cache file, so the key is hashed once
+        self._cache_path_cache = {}
         
         # Setup controls
         self.setup_controls()
@@ -44,11 +65,18 @@ class CompleteEReader:
     
     def setup_controls(self):
         """Setup button callbacks"""
-        self.controls.register_callback('state_changed', self.on_state_changed)
-        self.controls.register_callback('page_change', self.on_page_change)
-        self.controls.register_callback('menu_action', self.on_menu_action)
-        self.controls.register_callback('chapter_select', self.on_chapter_select)
-        self.controls.register_callback('book_select', self.on_book_select)
+        def wakes(handler):
+            # Nudge the run loop awake before handling the event
+            def wrapped(*args):
+                self._wake_event.set()
+                return handler(*args)
+            return wrapped
+
+        self.controls.register_callback('state_changed', wakes(self.on_state_changed))
+        self.controls.register_callback('page_change', wakes(self.on_page_change))
+        self.controls.register_callback('menu_action', wakes(self.on_menu_action))
+        self.controls.register_callback('chapter_select', wakes(self.on_chapter_select))
+        self.controls.register_callback('book_select', wakes(self.on_book_select))
     
     def load_books_list(self):
         """Load list of all books"""
@@ -75,13 +103,18 @@ class CompleteEReader:
         # Save as last book
         self.book_manager.save_last_book(self.book_path)
         
-        # Load from cache or process (includes chapters)
-        text, pages, chapters = extract_text_fast(book_path)
+        # Rendered pages from the previous book can't be reused
+        self.display.clear_page_cache()
+
+        # Load from cache or process (includes chapters and their pages);
+        # pass the normalized path so the cache key matches _cache_file_for
+        text, pages, chapters, chapter_page_map = extract_text_fast(self.book_path)
         self.pages = pages
         self.chapters = chapters
-        
+        self.chapter_page_map = chapter_page_map
+
         # Set chapters in controls
-        self.controls.set_chapters(chapters)
+        self.controls.set_chapters(chapters, chapter_page_map)
         
         # Load bookmark
         saved_page = self.bookmark_manager.load_bookmark(book_path)
@@ -113,14 +146,15 @@ class CompleteEReader:
     
     def check_background_processing(self):
         """Check if background book processing has completed"""
-        from book import check_processing_complete
         result = check_processing_complete()
         
         if result and result['book_path'] == self.book_path:
             print(f"🔄 Background processing complete: {len(result['pages'])} pages")
+            self.display.clear_page_cache()
             self.pages = result['pages']
             self.chapters = result['chapters']
-            self.controls.set_chapters(self.chapters)
+            self.chapter_page_map = result.get('chapter_page_map', {})
+            self.controls.set_chapters(self.chapters, self.chapter_page_map)
             
             # Adjust current page if needed
             if self.current_page >= len(self.pages):
@@ -143,19 +177,18 @@ class CompleteEReader:
         print(f"🔄 Refreshing book: {os.path.basename(self.book_path)}")
         
         # Clear cache for this book
-        import hashlib
-        book_hash = hashlib.md5(self.book_path.encode()).hexdigest()[:16]
-        cache_file = os.path.join(config.CACHE_DIR, f"{book_hash}.pkl.gz")
-        if os.path.exists(cache_file):
+        cache_file = self._cache_file_for(self.book_path)
+        if cache_file and os.path.exists(cache_file):
             os.remove(cache_file)
             print("🧹 Cleared cache")
         
         # Reload book
-        from book import extract_text_fast
-        text, pages, chapters = extract_text_fast(self.book_path)
+        self.display.clear_page_cache()
+        text, pages, chapters, chapter_page_map = extract_text_fast(self.book_path)
         self.pages = pages
         self.chapters = chapters
-        self.controls.set_chapters(chapters)
+        self.chapter_page_map = chapter_page_map
+        self.controls.set_chapters(chapters, chapter_page_map)
         
         # Reset to page 1
         self.current_page = 0
@@ -164,8 +197,31 @@ class CompleteEReader:
         
         print(f"✅ Refreshed: {len(pages)} initial pages (full processing in background)")
     
+    def _cache_file_for(self, book_path):
+        """Cache file book.extract_text_fast derives for this book
+
+        Mirrors its (path, mtime, size) key so refreshes actually hit the
+        file the extractor wrote — the old md5-of-path guess never matched
+        — and memoizes the result per book path.
+        """
+        cached = self._cache_path_cache.get(book_path)
+        if cached is None:
+            try:
+                stat = os.stat(book_path)
+            except OSError:
+                return None
+            cache_key = f"{book_path}_{stat.st_mtime}_{stat.st_size}"
+            cached = os.path.join(os.path.expanduser(config.CACHE_DIR),
+                                  f"{fast_hash(cache_key)}.pkl.gz")
+            self._cache_path_cache[book_path] = cached
+        return cached
+
     def render_current_state(self, force_full=False):
         """Render based on current state"""
+        with self._render_lock:
+            return self._render_current_state(force_full)
+
+    def _render_current_state(self, force_full=False):
         if self.controls.current_state == "READING":
             img = self.display.render_reading_page(self.font, self.pages, self.current_page)
         
@@ -225,20 +281,63 @@ class CompleteEReader:
             # Fallback to reading
             img = self.display.render_reading_page(self.font, self.pages, self.current_page)
         
+        # Semantic state of this frame; display_page skips the push when it
+        # matches what the panel already shows. Reading pages include the
+        # minute so the footer clock still ticks.
+        state_key = (self.controls.current_state, self.controls.menu_index,
+                     self.controls.submenu_index, self.controls.chapter_menu_index,
+                     self.controls.browser_index, self.controls.browser_page,
+                     self.current_page, len(self.pages))
+        if self.controls.current_state == "READING":
+            state_key += (datetime.datetime.now().minute,)
+
         # Display the image
-        used_partial = self.display.display_page(img, force_full=force_full)
+        used_partial = self.display.display_page(img, force_full=force_full,
+                                                 state_key=state_key)
         return used_partial
     
+    def refresh_clock(self):
+        """Redraw only the footer clock region of the reading page"""
+        if not self.pages:
+            return
+        with self._render_lock:
+            img = self.display.render_reading_page(self.font, self.pages,
+                                                   self.current_page)
+            font_height = FastFontCache.get_line_height(self.font) - 1
+            margin = config.DISPLAY_MARGIN
+            footer_y = config.DISPLAY_HEIGHT - margin - font_height
+            self.display.display_page_region(
+                img, (margin, footer_y - 2, margin + 80,
+                      footer_y + font_height))
+
     def on_state_changed(self, new_state, selected_index):
         """Handle state change from controls"""
         print(f"🔄 State: {new_state}")
         self.render_current_state()
     
     def on_page_change(self, delta):
-        """Handle page change request"""
+        """Handle page change request, coalescing rapid bursts"""
         if not self.pages:
             return
-        
+
+        # Accumulate and restart the short flush window; only the final
+        # page of a burst gets rendered and pushed to the panel
+        with self._pending_lock:
+            self._pending_delta += delta
+            if self._pending_timer:
+                self._pending_timer.cancel()
+            self._pending_timer = threading.Timer(0.08, self._flush_page_change)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+
+    def _flush_page_change(self):
+        """Apply the accumulated page delta once"""
+        with self._pending_lock:
+            delta = self._pending_delta
+            self._pending_delta = 0
+        if not delta or not self.pages:
+            return
+
         new_page = self.current_page + delta
         new_page = max(0, min(new_page, len(self.pages) - 1))
         
@@ -267,19 +366,22 @@ class CompleteEReader:
         chapter_name = self.chapters[chapter_index]
         print(f"📖 Jumping to chapter: {chapter_name}")
         
-        # Estimate page based on chapter index
-        # This is simplified - in a real implementation, you'd have exact page mapping
+        # Exact page from the chapter map; fall back to a linear estimate
+        # for chapters the map couldn't locate
         if self.pages:
-            estimated_page = int((chapter_index / len(self.chapters)) * len(self.pages))
-            estimated_page = max(0, min(estimated_page, len(self.pages) - 1))
-            
+            target_page = self.chapter_page_map.get(chapter_index)
+            if target_page is None:
+                target_page = int((chapter_index / len(self.chapters)) * len(self.pages))
+            target_page = max(0, min(target_page, len(self.pages) - 1))
+
             old_page = self.current_page
-            self.current_page = estimated_page
-            
+            self.current_page = target_page
+
             print(f"📄 Jumped from page {old_page+1} to page {self.current_page+1}")
-            
-            # Force full refresh for large jumps
-            self.display.needs_clear = True
+
+            # Force full refresh only for large jumps
+            if abs(target_page - old_page) > 5:
+                self.display.needs_clear = True
             self.render_current_state()
             
             # Save bookmark
@@ -313,13 +415,14 @@ class CompleteEReader:
             self.display.clear_display()
             
             # Show sleep message
-            img = self.display.render_confirmation(
-                "SLEEPING",
-                "Display is sleeping\n\nPress any button\nto wake",
-                ["", ""],
-                0
-            )
-            self.display.display_page(img, force_full=True)
+            with self._render_lock:
+                img = self.display.render_confirmation(
+                    "SLEEPING",
+                    "Display is sleeping\n\nPress any button\nto wake",
+                    ["", ""],
+                    0
+                )
+                self.display.display_page(img, force_full=True)
             time.sleep(0.5)
             
             # Put display to sleep
@@ -343,27 +446,15 @@ class CompleteEReader:
     
     def wait_for_wake(self):
         """Wait for any button press to wake"""
-        import RPi.GPIO as GPIO
-        
-        # Set up GPIO for polling
-        buttons = [
-            self.controls.BTN_PREV,
-            self.controls.BTN_NEXT,
-            self.controls.BTN_MENU,
-            self.controls.BTN_BACK
-        ]
-        
-        # Poll for button press
-        for _ in range(1000):  # Wait up to 10 seconds
-            for pin in buttons:
-                if GPIO.input(pin) == GPIO.LOW:
-                    print("Button pressed, waking...")
-                    time.sleep(0.2)  # Debounce
-                    return
-            time.sleep(0.01)
-        
-        # If no button pressed, wake anyway after timeout
-        print("Timeout, waking automatically...")
+        # Poll the pins directly: this runs on the button-dispatch thread,
+        # so the monitor that sets wake_event is blocked right here and
+        # could never signal it
+        if self.controls.wait_for_press(timeout=10):
+            print("Button pressed, waking...")
+            time.sleep(0.2)  # Debounce
+        else:
+            # If no button pressed, wake anyway after timeout
+            print("Timeout, waking automatically...")
     
     def shutdown(self):
         """Shutdown the e-reader"""
@@ -376,13 +467,14 @@ class CompleteEReader:
         self.display.clear_display()
         
         # Show shutdown message
-        img = self.display.render_confirmation(
-            "SHUTDOWN",
-            "Goodbye!\n\nShutting down...",
-            ["", ""],
-            0
-        )
-        self.display.display_page(img, force_full=True)
+        with self._render_lock:
+            img = self.display.render_confirmation(
+                "SHUTDOWN",
+                "Goodbye!\n\nShutting down...",
+                ["", ""],
+                0
+            )
+            self.display.display_page(img, force_full=True)
         time.sleep(1)
         
         self.display.sleep()
@@ -429,6 +521,7 @@ class CompleteEReader:
             last_page = -1
             last_save_time = time.time()
             last_processing_check = time.time()
+            last_minute = datetime.datetime.now().minute
             
             while True:
                 # Auto-save every minute
@@ -451,8 +544,22 @@ class CompleteEReader:
                     pages_until_refresh = self.display.full_refresh_interval - self.display.page_counter
                     print(f"📄 Page {self.current_page+1}/{len(self.pages)} (Next full: {pages_until_refresh})")
                     last_page = self.current_page
-                
-                time.sleep(0.1)
+
+                # Tick the footer clock with a windowed update on minute
+                # rollover rather than re-pushing the whole frame
+                now_minute = datetime.datetime.now().minute
+                if now_minute != last_minute:
+                    last_minute = now_minute
+                    if (self.controls.current_state == "READING"
+                            and self.pages and self.display.show_time):
+                        self.refresh_clock()
+
+                # Sleep until a button callback fires or the next timer is
+                # due, instead of waking every 100 ms
+                next_deadline = min(last_save_time + 60,
+                                    last_processing_check + 5) - time.time()
+                self._wake_event.wait(timeout=max(0.05, next_deadline))
+                self._wake_event.clear()
                 
         except KeyboardInterrupt:
             print("\n⏹️  Shutting down...")
@@ -0,0 +1,36 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# pireader_ext.pyx - Compiled wrap kernel for pagination
+#
+# Optional; build in place with:
+#   pip3 install cython
+#   python3 setup_ext.py build_ext --inplace
+
+def wrap_breaks(const unsigned char[:] buf, const double[:] advances,
+                double max_width, double space_width):
+    """Greedy wrap over an ASCII buffer; returns line end positions"""
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t i, j, word_start = 0
+    cdef double line_width = -1.0  # Sentinel: no words on the line yet
+    cdef double word_width
+    ends = []
+
+    for i in range(n + 1):
+        if i == n or buf[i] == 32:
+            word_width = 0.0
+            for j in range(word_start, i):
+                word_width += advances[buf[j]]
+
+            if line_width < 0:
+                line_width = word_width
+            elif line_width + space_width + word_width <= max_width:
+                line_width += space_width + word_width
+            else:
+                ends.append(word_start - 1)
+                line_width = word_width
+
+            word_start = i + 1
+
+    if line_width >= 0:
+        ends.append(n)
+
+    return ends
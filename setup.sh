@@ -14,7 +14,15 @@ sudo apt install -y python3-pip python3-pil python3-rpi.gpio
 
 # Install Python libraries
 echo "📚 Installing ebooklib and dependencies..."
-pip3 install ebooklib beautifulsoup4
+pip3 install ebooklib beautifulsoup4 lxml msgpack zstandard
+
+# Optionally build the compiled pagination kernel
+echo "🔧 Building compiled pagination kernel (optional)..."
+if pip3 install cython 2>/dev/null && python3 setup_ext.py build_ext --inplace 2>/dev/null; then
+    echo "✅ Compiled pagination kernel built"
+else
+    echo "⚠️ Could not build pireader_ext; the pure-Python paginator will be used"
+fi
 
 # Check if waveshare library exists
 echo "🔍 Checking for waveshare e-paper library..."
@@ -0,0 +1,13 @@
+#!/usr/bin/python3
+# setup_ext.py - Build the optional compiled pagination kernel
+#
+#   pip3 install cython
+#   python3 setup_ext.py build_ext --inplace
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="pireader_ext",
+    ext_modules=cythonize("pireader_ext.pyx", language_level=3),
+)